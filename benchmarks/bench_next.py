@@ -0,0 +1,70 @@
+# ----------------------------------------
+# ⏱️ Benchmark: `todo next` vs `todo list --undone --sort priority`
+# Compares picking the top K open tasks from the persisted heap index
+# with loading, filtering and sorting the whole task list, and shows what
+# keeping the index up to date adds to a write (`todo add`).
+# Usage: python benchmarks/bench_next.py [--tasks N] [-k K] [--repeat R]
+# ----------------------------------------
+
+import argparse
+import os
+import random
+import tempfile
+import timeit
+from datetime import date, timedelta
+
+from todo_cli import core
+from todo_cli.main import filter_tasks
+
+def generate_tasks(count: int) -> list[core.Task]:
+    """
+    Build a list of random tasks, about a third of them completed.
+    """
+    rng = random.Random(42)
+    start = date(2025, 1, 1)
+    return [
+        {
+            "id": i,
+            "text": f"Task {i}",
+            "done": rng.random() < 0.33,
+            "priority": rng.choice(core.VALID_PRIORITIES),
+            "created": f"2025-01-01T00:00:{i % 60:02d}+00:00",
+            "due": (start + timedelta(days=rng.randrange(365))).isoformat() if rng.random() < 0.7 else "",
+            "tags": [],
+        }
+        for i in range(1, count + 1)
+    ]
+
+def list_sorted(k: int) -> list[core.Task]:
+    args = argparse.Namespace(done=False, undone=True, priority=None, sort="priority", tags=None, from_date=None, to_date=None)
+    return filter_tasks(core.list_tasks(), args)[:k]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark `todo next` against a full sorted `todo list`.")
+    parser.add_argument("--tasks", type=int, default=50_000, help="Number of tasks in the store (default: 50000)")
+    parser.add_argument("-k", type=int, default=10, help="Number of tasks to pick (default: 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (default: 5)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        core.DATA_FILE = os.path.join(tmp, "todo_data.json")
+        core.save_tasks(generate_tasks(args.tasks))
+        core.add_task("Warm-up")  # The first change builds the index
+
+        next_time = min(timeit.repeat(lambda: core.next_tasks(args.k), number=1, repeat=args.repeat))
+        list_time = min(timeit.repeat(lambda: list_sorted(args.k), number=1, repeat=args.repeat))
+
+        # Write side: an add with index maintenance vs the load and save it can't avoid
+        add_time = min(timeit.repeat(lambda: core.add_task("Benchmark"), number=1, repeat=args.repeat))
+        save_time = min(timeit.repeat(lambda: core.save_tasks(core.load_tasks()), number=1, repeat=args.repeat))
+
+    print(f"{args.tasks} tasks, top {args.k}")
+    print(f"  todo next -n {args.k}:               {next_time * 1000:8.2f} ms")
+    print(f"  todo list --undone --sort priority: {list_time * 1000:8.2f} ms")
+    print(f"  speedup: {list_time / next_time:.1f}x")
+    print(f"  todo add (with index):              {add_time * 1000:8.2f} ms")
+    print(f"  load + save only:                   {save_time * 1000:8.2f} ms")
+    print(f"  index overhead: {(add_time / save_time - 1) * 100:.0f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+# ----------------------------------------
+# 🔗 Client Module for Todo CLI X
+# Talks to a `todo serve` sync server instead of the local JSON file.
+# Keeps HTTP connections alive in a small pool and a local cache of the
+# task list, so each sync only downloads what changed since the last one.
+# ----------------------------------------
+
+import heapq
+import http.client
+import json
+import os
+import queue
+from typing import Any, List, Optional
+from urllib.parse import urlsplit
+
+from . import core
+
+# ----------------------------------------
+# 📁 Local sync cache
+# ----------------------------------------
+# File where the last synced copy of the remote task list is kept
+CACHE_FILE = "todo_sync_cache.json"
+
+# ----------------------------------------
+# ⚠️ Errors
+# ----------------------------------------
+
+class BatchError(ValueError):
+    """
+    Some operations of a batch failed. The server still applied the others:
+    `results` holds one result per operation (None where it failed) and
+    `errors` maps the index of each failed operation to its message.
+    """
+
+    def __init__(self, results: list[Any], errors: dict[int, str]) -> None:
+        self.results = results
+        self.errors = errors
+        first = min(errors)
+        super().__init__(errors[first] if len(results) == 1 else f"{len(errors)} of {len(results)} operations failed, first: {errors[first]}")
+
+# ----------------------------------------
+# 🏊 Connection pool
+# ----------------------------------------
+
+class ConnectionPool:
+    """
+    Reuse keep-alive HTTP connections to one server.
+    Connections are created on demand, up to `size` are kept idle.
+    A `token` is sent with every request as a bearer token.
+    """
+
+    def __init__(self, host: str, port: int, size: int = 4, timeout: float = 10.0, token: Optional[str] = None) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.token = token
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=size)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(self, method: str, path: str, payload: Any = None) -> Any:
+        """
+        Send a JSON request and return the decoded JSON response.
+        Raises ValueError with the server's message on an error answer,
+        or if the answer isn't JSON (e.g. the address isn't a sync server).
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        conn = self._acquire()
+        try:
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # The server closed an idle keep-alive connection: retry once on a fresh one
+                conn.close()
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+            try:
+                data = json.loads(response.read() or b"null")
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                raise ValueError(
+                    f"{self.host}:{self.port} answered HTTP {response.status} without JSON, "
+                    "is it a todo sync server?"
+                )
+        except BaseException:
+            conn.close()
+            raise
+        self._release(conn)
+        if response.status >= 400:
+            error = data.get("error") if isinstance(data, dict) else None
+            raise ValueError(error or f"Server error {response.status}")
+        return data
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+# ----------------------------------------
+# 🛰️ Remote task store
+# ----------------------------------------
+
+class RemoteStore:
+    """
+    Task store backed by a sync server, with the same functions as `core`.
+    Every request carries the revision of the last sync and merges the
+    returned delta into the local cache.
+    """
+
+    def __init__(self, url: str, cache_file: Optional[str] = None, token: Optional[str] = None) -> None:
+        parts = urlsplit(url if "//" in url else f"http://{url}")
+        try:
+            port = parts.port or 8765
+        except ValueError:
+            raise ValueError(f"Invalid sync server address: {url} (expected HOST:PORT)")
+        self.url = url
+        self.cache_file = cache_file or CACHE_FILE
+        self.pool = ConnectionPool(parts.hostname or "127.0.0.1", port, token=token)
+        self._cache = self._load_cache()
+
+    # ---------------------------
+    # 🔄 Cache handling
+    # ---------------------------
+
+    def _load_cache(self) -> dict[str, Any]:
+        empty: dict[str, Any] = {"server": self.url, "epoch": None, "revision": 0, "tasks": {}}
+        if not os.path.exists(self.cache_file):
+            return empty
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            try:
+                cache = json.load(f)
+            except json.JSONDecodeError:
+                return empty
+        if cache.get("server") != self.url:
+            return empty
+        cache["tasks"] = {int(task_id): task for task_id, task in cache["tasks"].items()}
+        return cache
+
+    def _merge(self, delta: dict[str, Any]) -> None:
+        if delta["full"]:
+            self._cache["tasks"] = {}
+        tasks = self._cache["tasks"]
+        for task in delta["tasks"]:
+            tasks[task["id"]] = task
+        for task_id in delta["deleted"]:
+            tasks.pop(task_id, None)
+        self._cache["epoch"] = delta["epoch"]
+        self._cache["revision"] = delta["revision"]
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump(self._cache, f, ensure_ascii=False)
+
+    def sync(self) -> None:
+        """
+        Download what changed on the server since the last sync.
+        """
+        path = f"/sync?since={self._cache['revision']}"
+        if self._cache["epoch"]:
+            path += f"&epoch={self._cache['epoch']}"
+        self._merge(self.pool.request("GET", path))
+
+    def batch(self, ops: list[dict[str, Any]]) -> list[Any]:
+        """
+        Send several operations in one request. Returns one result per
+        operation. If any failed, raises BatchError, which still carries the
+        results of the operations the server applied.
+        """
+        response = self.pool.request("POST", "/batch", {
+            "ops": ops,
+            "since": self._cache["revision"],
+            "epoch": self._cache["epoch"],
+        })
+        self._merge(response)
+        results = [result.get("ok") for result in response["results"]]
+        errors = {i: result["error"] for i, result in enumerate(response["results"]) if "error" in result}
+        if errors:
+            raise BatchError(results, errors)
+        return results
+
+    def close(self) -> None:
+        self.pool.close()
+
+    # ---------------------------
+    # 📝 Store functions (same as core)
+    # ---------------------------
+
+    def list_tasks(self) -> List[core.Task]:
+        self.sync()
+        return [self._cache["tasks"][task_id] for task_id in sorted(self._cache["tasks"])]
+
+    def next_tasks(self, count: int = 1) -> List[core.Task]:
+        if count < 1:
+            raise ValueError("The number of tasks must be a positive number.")
+        open_tasks = [t for t in self.list_tasks() if not t["done"]]
+        return heapq.nsmallest(count, open_tasks, key=core.task_order_key)
+
+    def add_task(
+            self,
+            text: str,
+            priority: core.Priority = "medium",
+            due: Optional[str] = None,
+            tags: Optional[list[str]] = None,
+            repeat: Optional[core.RepeatDict] = None,
+    ) -> core.Task:
+        op = {"op": "add", "text": text, "priority": priority, "due": due, "tags": tags, "repeat": repeat}
+        return self.batch([op])[0]
+
+    def complete_task(self, task_id: int) -> Optional[core.Task]:
+        return self.batch([{"op": "complete", "id": task_id}])[0]
+
+    def delete_task(self, task_id: int) -> Optional[core.Task]:
+        return self.batch([{"op": "delete", "id": task_id}])[0]
+
+    def delete_tasks(self, task_ids: list[int]) -> List[Optional[core.Task]]:
+        return self.batch([{"op": "delete", "id": task_id} for task_id in task_ids])
+
+    def edit_task(
+            self,
+            task_id: int,
+            text: Optional[str] = None,
+            priority: Optional[core.Priority] = None,
+            due: Optional[str] = None,
+            tags: Optional[list[str]] = None,
+    ) -> Optional[core.Task]:
+        op = {"op": "edit", "id": task_id, "text": text, "priority": priority, "due": due, "tags": tags}
+        return self.batch([op])[0]
+
+    def clear_tasks(self) -> None:
+        self.batch([{"op": "clear"}])
+
+    def bulk_update(self, query: core.BulkQuery, update: core.BulkUpdate, workers: int = 1) -> core.BulkResult:
+        """
+        Send the query and update as one operation: the server matches and
+        changes tasks against its current copy, so changes made by other
+        clients since the last sync are neither missed nor overwritten.
+        `workers` is ignored: the server runs it in a single process.
+        """
+        core.validate_bulk(query, update)
+        return self.batch([{"op": "bulk", "query": query, "update": update}])[0]
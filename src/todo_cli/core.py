@@ -5,16 +5,36 @@
 # It uses a JSON file to persist tasks across sessions.
 # ----------------------------------------
 
+import calendar
+import heapq
+import itertools
 import json
 import os
-from datetime import datetime, timezone
-from typing import List, Literal, TypedDict, Optional
+import re
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator, List, Literal, NotRequired, TextIO, TypedDict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None  # type: ignore[assignment]
 
 # ----------------------------------------
 # 📦 TypedDict for tasks with priority
 # ----------------------------------------
 
 Priority = Literal["low", "medium", "high"]
+Frequency = Literal["daily", "weekly", "monthly"]
+
+class RepeatDict(TypedDict):
+    frequency: Frequency
+    interval: int  # Repeat every N days/weeks/months
+    until: str     # Last allowed occurrence (YYYY-MM-DD), empty for no end
+    start: NotRequired[str]  # First occurrence (YYYY-MM-DD), every later one is computed from it
 
 class TaskDict(TypedDict):
     id: int
@@ -24,18 +44,39 @@ class TaskDict(TypedDict):
     created: str
     due: Optional[str]
     tags: Optional[list[str]]
+    repeat: NotRequired[RepeatDict]  # Only present on recurring tasks
+    next_id: NotRequired[int]        # Occurrence added when this recurring task was completed
+    rev: NotRequired[int]            # Last change revision, set by the sync server
 
 Task = TaskDict
 
 # Allowed priority values
 VALID_PRIORITIES: tuple[Priority, ...] = ("low", "medium", "high")
 
+# Allowed recurrence frequencies
+VALID_FREQUENCIES: tuple[Frequency, ...] = ("daily", "weekly", "monthly")
+
+# Rank used to order open tasks (lower comes first)
+PRIORITY_RANK: dict[str, int] = {"high": 0, "medium": 1, "low": 2}
+
 # ----------------------------------------
 # 📁 Data file
 # ----------------------------------------
 # File where tasks will be stored
 DATA_FILE = "todo_data.json"
 
+# Suffix of the ordered index of open tasks, stored next to DATA_FILE
+INDEX_SUFFIX = ".index.json"
+
+# Suffix of the lock file that serializes changes between processes
+LOCK_SUFFIX = ".lock"
+
+# Suffix of the backup kept when the data file can't be parsed
+CORRUPT_SUFFIX = ".corrupt"
+
+# Suffix of the file holding the highest ID ever assigned, so deleted IDs aren't reused
+LAST_ID_SUFFIX = ".last_id"
+
 # ---------------------------
 # 🔄 File operations
 # ---------------------------
@@ -44,6 +85,8 @@ def load_tasks() -> List[Task]:
     """
     Load the task list from the JSON file.
     If the file does not exist or is invalid, return an empty list.
+    An invalid file is first copied to DATA_FILE + ".corrupt", so the next
+    save can't silently destroy what was in it.
     """
     if not os.path.exists(DATA_FILE):
         return []
@@ -58,36 +101,496 @@ def load_tasks() -> List[Task]:
                     task["due"] = ""
             return tasks
         except json.JSONDecodeError:
+            shutil.copyfile(DATA_FILE, DATA_FILE + CORRUPT_SUFFIX)
             return []
 
 def save_tasks(tasks: List[Task]) -> None:
     """
     Save the task list to the JSON file.
     Tasks are stored with indentation and Unicode support.
+    The list is written to a temporary file that then replaces the data file
+    in one step, so readers never see a half-written file.
+    """
+    with _atomic_write(DATA_FILE) as f:
+        _write_tasks(f, tasks)
+
+def _write_tasks(f: TextIO, tasks: List[Task]) -> dict[int, tuple[int, int]]:
+    """
+    Write tasks as an indented JSON list and return where each task's object
+    landed in the file: {id: (byte offset, byte length)}.
+    With indent=2, every task starts on a line opening with "  {" and ends on
+    one with "  }" (nested values are indented further and strings can't hold
+    a raw newline), so the objects are found without parsing anything.
+    """
+    text = json.dumps(tasks, indent=2, ensure_ascii=False)
+    f.write(text)
+    data = text.encode("utf-8")
+    spans: dict[int, tuple[int, int]] = {}
+    pos = 0
+    for task in tasks:
+        start = data.index(b"\n  {", pos) + 3
+        pos = data.index(b"\n  }", start) + 4
+        spans[task["id"]] = (start, pos - start)
+    return spans
+
+@contextmanager
+def _atomic_write(path: str) -> Iterator[TextIO]:
+    """
+    Open a temporary file next to `path` for writing and move it over `path`
+    once the block completes. On error, `path` is left untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".todo_", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            yield f
+        os.chmod(tmp_path, _data_file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+@contextmanager
+def _locked() -> Iterator[None]:
+    """
+    Hold an exclusive lock for a whole load-modify-save cycle, so concurrent
+    processes can't overwrite each other's changes. Readers don't need it:
+    saves are atomic. Without fcntl (Windows), changes are not serialized.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.splitext(DATA_FILE)[0] + LOCK_SUFFIX, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+def _next_id(tasks: List[Task], count: int = 1) -> int:
+    """
+    Reserve `count` consecutive IDs for new tasks and return the first one.
+    IDs follow the highest one ever assigned, which is kept in a file next to
+    the data file: once its task is deleted (even by a clear), an ID never
+    comes back, so a stale ID can't reach a newer task. Must be called under
+    the lock.
+    """
+    last_file = os.path.splitext(DATA_FILE)[0] + LAST_ID_SUFFIX
+    try:
+        with open(last_file, "r", encoding="utf-8") as f:
+            last = int(f.read())
+    except (FileNotFoundError, ValueError):
+        last = 0
+    # The list is not guaranteed to be sorted by ID (e.g. after a hand edit)
+    first = max(last, max((t["id"] for t in tasks), default=0)) + 1
+    with _atomic_write(last_file) as f:
+        f.write(str(first + count - 1))
+    return first
+
+Signature = tuple[int, int, int]
+
+def file_signature(path: str) -> Optional[Signature]:
+    """
+    Return a cheap fingerprint of a file: (mtime_ns, size, inode).
+    Returns None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _stat_signature(st)
+
+def _stat_signature(st: os.stat_result) -> Signature:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _data_file_mode() -> int:
+    # Keep the existing permissions; new files get the usual umask-based mode
+    if os.path.exists(DATA_FILE):
+        return os.stat(DATA_FILE).st_mode & 0o777
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# ---------------------------
+# 🗂️ Open task index
+# ---------------------------
+# A binary min-heap of open tasks keyed on (priority, due, created, id),
+# persisted next to DATA_FILE. Entries only hold the keys and where the task
+# sits in the data file, so the top tasks are read straight from there.
+# It is updated incrementally on every change and tagged with the data file
+# signature it matches, so edits made outside of this module are detected.
+
+IndexEntry = list[Any]  # [priority rank, due, created, id, byte offset, byte length]
+
+# Bumped when the entry layout changes, so older index files are ignored
+INDEX_FORMAT = 2
+
+# Above this many changes at once, rebuilding the heap beats removing entries one by one
+INDEX_REBUILD_THRESHOLD = 16
+
+def _index_file() -> str:
+    return os.path.splitext(DATA_FILE)[0] + INDEX_SUFFIX
+
+def task_order_key(task: Task) -> tuple[int, str, str, int]:
+    """
+    Return the key used to pick the next tasks: priority, then due date, then age.
+    Tasks without a due date come after every dated task.
+    """
+    return (PRIORITY_RANK.get(task["priority"], 1), task.get("due") or "9999-12-31", task.get("created") or "", task["id"])
+
+def _index_entry(task: Task) -> IndexEntry:
+    return [*task_order_key(task), 0, 0]  # Location filled in once the data file is written
+
+def _build_index(tasks: List[Task]) -> List[IndexEntry]:
+    heap = [_index_entry(t) for t in tasks if not t["done"]]
+    heapq.heapify(heap)
+    return heap
+
+def _open_index(source: Any) -> Optional[TextIO]:
+    """
+    Open the index file positioned on its first heap entry, if it matches
+    the given data file signature. Returns None if it is missing or stale.
+    The file holds a header line followed by one heap entry per line, in
+    heap order, so the top of the heap can be read without parsing the rest.
+    """
+    if source is None or not os.path.exists(_index_file()):
+        return None
+    f = open(_index_file(), "r", encoding="utf-8")
+    try:
+        header = json.loads(f.readline())
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        header = None
+    if (
+        not isinstance(header, dict)
+        or header.get("source") != list(source)
+        or header.get("format") != INDEX_FORMAT
+    ):
+        f.close()
+        return None
+    return f
+
+def _load_index(source: Any) -> Optional[List[IndexEntry]]:
+    """
+    Return the whole persisted heap if it matches the given data file signature, None otherwise.
+    """
+    f = _open_index(source)
+    if f is None:
+        return None
+    with f:
+        try:
+            # One parse for the whole file instead of one per line
+            return json.loads("[" + ",".join(f) + "]")
+        except json.JSONDecodeError:
+            return None
+
+def _save_index(heap: List[IndexEntry], source: Any) -> None:
+    """
+    Write the heap, tagged with the signature of the data file it was built from.
+    """
+    with _atomic_write(_index_file()) as f:
+        f.write(json.dumps({"source": list(source) if source else None, "format": INDEX_FORMAT}) + "\n")
+        # Encoding the whole heap in one call is much faster than once per entry;
+        # fall back if a (hand-edited) date happens to contain the separator
+        lines = json.dumps(heap, separators=(",", ":"))[1:-1].replace("],[", "]\n[")
+        if lines.count("\n") != max(0, len(heap) - 1):
+            lines = "\n".join(json.dumps(entry) for entry in heap)
+        f.write(lines + "\n" if heap else "")
+
+def _heap_sift(heap: List[IndexEntry], positions: dict[int, int], pos: int) -> None:
+    """
+    Move the entry at `pos` up or down to restore the heap property,
+    keeping `positions` (task ID -> heap position) in sync.
+    """
+    def swap(i: int, j: int) -> None:
+        heap[i], heap[j] = heap[j], heap[i]
+        positions[heap[i][3]], positions[heap[j][3]] = i, j
+
+    # Move it up while it is smaller than its parent...
+    while pos > 0 and heap[pos] < heap[(pos - 1) // 2]:
+        swap(pos, (pos - 1) // 2)
+        pos = (pos - 1) // 2
+    # ...or down while a child is smaller
+    while True:
+        child = 2 * pos + 1
+        if child >= len(heap):
+            break
+        if child + 1 < len(heap) and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[pos] <= heap[child]:
+            break
+        swap(pos, child)
+        pos = child
+
+def _heap_remove(heap: List[IndexEntry], positions: dict[int, int], task_id: int) -> None:
+    """
+    Remove a task from the heap by ID in O(log n).
+    """
+    pos = positions.pop(task_id, None)
+    if pos is None:
+        return
+    last = heap.pop()
+    if pos == len(heap):
+        return
+    heap[pos] = last
+    positions[last[3]] = pos
+    _heap_sift(heap, positions, pos)
+
+def _heap_push(heap: List[IndexEntry], positions: dict[int, int], entry: IndexEntry) -> None:
+    heap.append(entry)
+    positions[entry[3]] = len(heap) - 1
+    _heap_sift(heap, positions, len(heap) - 1)
+
+def _commit(tasks: List[Task], changed: Iterable[Task] = (), removed: Iterable[int] = ()) -> None:
+    """
+    Save the task list and apply the same change to the open task index.
+    `changed` are added or updated tasks, `removed` are IDs that no longer exist.
+    """
+    before = file_signature(DATA_FILE)
+    with _atomic_write(DATA_FILE) as f:
+        spans = _write_tasks(f, tasks)
+    after = file_signature(DATA_FILE)
+
+    changed, removed = list(changed), list(removed)
+    heap: Optional[List[IndexEntry]] = None
+    if tasks and len(changed) + len(removed) <= INDEX_REBUILD_THRESHOLD:
+        heap = _load_index(before)
+    if heap is not None:
+        positions = {entry[3]: pos for pos, entry in enumerate(heap)}
+        for task_id in itertools.chain(removed, (t["id"] for t in changed)):
+            _heap_remove(heap, positions, task_id)
+        for task in changed:
+            if not task["done"]:
+                _heap_push(heap, positions, _index_entry(task))
+        if len(positions) != len(heap) or any(task_id not in spans for task_id in positions):
+            heap = None  # The index matched another version of the file (written without the lock)
+    if heap is None:
+        heap = _build_index(tasks)
+    # Every task after a changed one has moved in the file
+    for entry in heap:
+        entry[4:] = spans[entry[3]]
+    _save_index(heap, after)
+
+def next_tasks(count: int = 1) -> List[Task]:
+    """
+    Return the top `count` open tasks by priority, then due date, then age.
+    Walks only the top of the persisted heap, reading index lines up to the
+    deepest visited entry, then reads just the chosen tasks from the data file:
+    no full load and no sort (O(count log count) heap operations).
+    If the data file was changed outside of this module, the whole list is
+    scanned instead until the next change rebuilds the index.
+    """
+    if count < 1:
+        raise ValueError("The number of tasks must be a positive number.")
+    try:
+        data = open(DATA_FILE, "rb")
+    except FileNotFoundError:
+        return []
+
+    with data:
+        # Signature of the file actually opened, so offsets can't point into a newer one
+        f = _open_index(_stat_signature(os.fstat(data.fileno())))
+        if f is None:
+            return heapq.nsmallest(count, (t for t in load_tasks() if not t["done"]), key=task_order_key)
+
+        with f:
+            lines: List[str] = []
+
+            def entry_at(pos: int) -> Optional[IndexEntry]:
+                while len(lines) <= pos:
+                    line = f.readline()
+                    if not line:
+                        return None
+                    lines.append(line)
+                return json.loads(lines[pos])
+
+            chosen: List[IndexEntry] = []
+            root = entry_at(0)
+            frontier = [(root, 0)] if root is not None else []
+            while frontier and len(chosen) < count:
+                entry, pos = heapq.heappop(frontier)
+                chosen.append(entry)
+                for child in (2 * pos + 1, 2 * pos + 2):
+                    child_entry = entry_at(child)
+                    if child_entry is not None:
+                        heapq.heappush(frontier, (child_entry, child))
+
+        result: List[Task] = []
+        for entry in chosen:
+            data.seek(entry[4])
+            result.append(json.loads(data.read(entry[5])))
+    return result
+
+# ---------------------------
+# 🔁 Recurrence
+# ---------------------------
+
+def parse_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date string.
+    Raises ValueError with a user-friendly message if the format is wrong.
+    """
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError("Due date must be in YYYY-MM-DD format.")
+
+def make_repeat(frequency: Frequency, interval: int = 1, until: Optional[str] = None) -> RepeatDict:
+    """
+    Build and validate a recurrence rule.
+    """
+    if frequency not in VALID_FREQUENCIES:
+        raise ValueError(f"Invalid frequency: {frequency}. Must be one of {VALID_FREQUENCIES}.")
+    if not isinstance(interval, int) or isinstance(interval, bool) or interval < 1:
+        raise ValueError("Repeat interval must be a positive number.")
+    if until:
+        parse_date(until)
+    return {"frequency": frequency, "interval": interval, "until": until or ""}
+
+def _add_months(start: date, months: int) -> date:
+    """
+    Shift a date by a number of months, clamping to the last day of shorter months.
+    """
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+    day = min(start.day, calendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+def _nth_occurrence(anchor: date, repeat: RepeatDict, n: int) -> date:
+    """
+    Return the n-th occurrence of a rule starting at `anchor` (n=0 is the anchor itself).
+    Always computed from the anchor so monthly rules don't drift after a short month.
+    """
+    step = repeat["interval"] * n
+    if repeat["frequency"] == "daily":
+        return anchor + timedelta(days=step)
+    if repeat["frequency"] == "weekly":
+        return anchor + timedelta(weeks=step)
+    return _add_months(anchor, step)
+
+def _anchor(task: Task) -> date:
+    """
+    Return the date a task's occurrences are computed from: the rule's first
+    occurrence, or the current due date for tasks saved before it was stored.
+    """
+    repeat = task.get("repeat")
+    return parse_date((repeat or {}).get("start") or task["due"] or "")
+
+def iter_occurrences(task: Task, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[date]:
+    """
+    Lazily yield the due dates of a task within [start, end].
+    - A non-recurring task yields its due date at most once.
+    - A recurring task yields dates from its current due date onward, until the
+      rule's end date or `end`. With neither, the generator is infinite.
+    """
+    if not task.get("due"):
+        return iter(())
+    return _task_occurrences(task, task.get("repeat"), start, end)
+
+def _task_occurrences(task: Task, repeat: Optional[RepeatDict], start: Optional[date], end: Optional[date]) -> Iterator[date]:
+    due = parse_date(task["due"] or "")
+    if repeat is None:
+        return _occurrences(due, None, start, end)
+    # Count from the first occurrence, not the current one, so a monthly rule
+    # that was clamped once (Jan 31 -> Feb 28) goes back to the 31st afterwards
+    return _occurrences(_anchor(task), repeat, max(due, start) if start else due, end)
+
+def _occurrences(anchor: date, repeat: Optional[RepeatDict], start: Optional[date], end: Optional[date]) -> Iterator[date]:
+    if repeat is None:
+        if (start is None or anchor >= start) and (end is None or anchor <= end):
+            yield anchor
+        return
+
+    until = parse_date(repeat["until"]) if repeat["until"] else None
+    if until is not None and (end is None or until < end):
+        end = until
+
+    # Jump close to the window start instead of walking every occurrence from the anchor
+    n = 0
+    if start is not None and start > anchor:
+        if repeat["frequency"] == "monthly":
+            months = (start.year - anchor.year) * 12 + start.month - anchor.month
+            n = max(0, months // repeat["interval"] - 1)
+        else:
+            days = 7 * repeat["interval"] if repeat["frequency"] == "weekly" else repeat["interval"]
+            n = (start - anchor).days // days
+
+    for n in itertools.count(n):
+        occurrence = _nth_occurrence(anchor, repeat, n)
+        if end is not None and occurrence > end:
+            return
+        if start is None or occurrence >= start:
+            yield occurrence
+
+def next_occurrence(task: Task) -> Optional[str]:
+    """
+    Return the due date following the task's current one, or None if the task
+    doesn't repeat or its rule has ended.
     """
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(tasks, f, indent=2, ensure_ascii=False)
+    if task.get("repeat") is None or not task.get("due"):
+        return None
+    following = parse_date(task["due"] or "") + timedelta(days=1)
+    upcoming = next(iter_occurrences(task, start=following), None)
+    return upcoming.isoformat() if upcoming else None
+
+def expand_occurrences(tasks: List[Task], start: Optional[date] = None, end: Optional[date] = None) -> Iterator[Task]:
+    """
+    Lazily yield one task row per due date within [start, end], ordered by due date.
+    Open recurring tasks are expanded into their occurrences; with no `end`,
+    only their next occurrence is shown. Tasks without a due date are skipped.
+    """
+    def rows(task: Task) -> Iterator[Task]:
+        # A completed occurrence is history: only its own due date counts
+        repeat = None if task["done"] else task.get("repeat")
+        try:
+            dates = _task_occurrences(task, repeat, start, end)
+        except ValueError:
+            return  # No usable due date
+        if repeat is not None and end is None:
+            dates = itertools.islice(dates, 1)
+        for occurrence in dates:
+            yield {**task, "due": occurrence.isoformat()}
+
+    # Each per-task stream is already sorted, so merging keeps the whole output lazy
+    return heapq.merge(*(rows(t) for t in tasks), key=lambda t: t["due"] or "")
 
 # ---------------------------
 # ➕ Task creation
 # ---------------------------
 
-def add_task(text: str, priority: Priority = "medium", due: Optional[str] = None, tags: Optional[list[str]] = None) -> Task:
+@_locked()
+def add_task(
+        text: str,
+        priority: Priority = "medium",
+        due: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+        repeat: Optional[RepeatDict] = None,
+) -> Task:
     """
     Create a new task and save it.
-    - Automatically assigns an ID based on the last task.
+    - Automatically assigns an ID after the highest existing one.
     - Sets the 'done' field to False by default.
+    - A recurring task without a due date starts today. Its rule is
+      validated again here and can't end before it starts.
     """
     if priority not in VALID_PRIORITIES:
         raise ValueError(f"Invalid priority: {priority}. Must be one of {VALID_PRIORITIES}.")
     
     if tags is None:
         tags = []
-        
+
+    if repeat is not None:
+        if due:
+            parse_date(due)
+        else:
+            due = date.today().isoformat()
+        # Rules may come from outside make_repeat (e.g. the sync server): rebuild them
+        repeat = make_repeat(repeat["frequency"], repeat.get("interval", 1), repeat.get("until"))
+        if repeat["until"] and repeat["until"] < due:
+            raise ValueError(f"Repeat end date {repeat['until']} is before the due date {due}.")
+
     # Load existing tasks to determine the next ID
     tasks = load_tasks()
-    last_id = tasks[-1]["id"] if tasks else 0
-    new_id = last_id + 1
+    new_id = _next_id(tasks)
 
     # Create the new task with the next ID
     task: Task = {
@@ -99,9 +602,11 @@ def add_task(text: str, priority: Priority = "medium", due: Optional[str] = None
         "due": due or "",
         "tags": tags,
     }
+    if repeat is not None:
+        task["repeat"] = {**repeat, "start": task["due"] or ""}
 
     tasks.append(task)
-    save_tasks(tasks)
+    _commit(tasks, changed=[task])
     return task
 
 # ---------------------------
@@ -122,29 +627,59 @@ def list_tasks() -> List[Task]:
 # ✅ Task completion
 # ---------------------------
 
+@_locked()
 def complete_task(task_id: int) -> Task | None:
     """
     Mark a task as completed by its ID.
+    For a recurring task, the next occurrence is added as a new open task
+    carrying the same rule, and its ID is recorded in the completed task's
+    `next_id`; later occurrences are never stored.
     Returns the updated task if found and updated, None otherwise.
     """
     tasks = load_tasks()
     for task in tasks:
         if task["id"] == task_id:
-            task["done"] = True
-            save_tasks(tasks)
+            upcoming = _mark_done(task)
+            changed = [task]
+            if upcoming is not None:
+                upcoming["id"] = task["next_id"] = _next_id(tasks)
+                tasks.append(upcoming)
+                changed.append(upcoming)
+            _commit(tasks, changed=changed)
             return task
     return None
 
+def _mark_done(task: Task) -> Optional[Task]:
+    """
+    Mark a task as done and return its next occurrence (without an ID yet)
+    if it is an open recurring task, None otherwise.
+    """
+    upcoming = next_occurrence(task) if not task["done"] else None
+    task["done"] = True
+    if upcoming is None:
+        return None
+    return {
+        **task,
+        "id": 0,
+        "done": False,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "due": upcoming,
+        "tags": list(task.get("tags") or []),
+        "repeat": {**task["repeat"]},
+    }
+
 # ---------------------------
 # ❌ Task deletion
 # ---------------------------
 
+@_locked()
 def clear_tasks() -> None:
     """
     Delete all tasks by saving an empty list.
     """
-    save_tasks([])
+    _commit([])
 
+@_locked()
 def delete_task(task_id: int) -> Task | None:
     """
     Delete a task by its ID.
@@ -154,13 +689,28 @@ def delete_task(task_id: int) -> Task | None:
     for task in tasks:
         if task["id"] == task_id:
             tasks.remove(task)
-            save_tasks(tasks)
+            _commit(tasks, removed=[task_id])
             return task
     return None
 
+@_locked()
+def delete_tasks(task_ids: List[int]) -> List[Task | None]:
+    """
+    Delete several tasks by ID with a single save.
+    Returns one entry per ID: the deleted task, or None if it was not found.
+    """
+    tasks = load_tasks()
+    by_id = {task["id"]: task for task in tasks}
+    deleted = [by_id.pop(task_id, None) for task_id in task_ids]
+    removed = [task["id"] for task in deleted if task is not None]
+    if removed:
+        _commit([task for task in tasks if task["id"] in by_id], removed=removed)
+    return deleted
+
 # ---------------------------
 # ✏️ Edit a task
 # ---------------------------
+@_locked()
 def edit_task(
         task_id: int,
         text: str | None = None,
@@ -183,14 +733,189 @@ def edit_task(
                     raise ValueError(f"Invalid priority: {priority}. Must be one of {VALID_PRIORITIES}.")
                 task["priority"] = priority
             if due is not None:
-                try:
-                    datetime.strptime(due, "%Y-%m-%d")
-                    task["due"] = due
-                except ValueError:
-                    raise ValueError("Due date must be in YYYY-MM-DD format.")
+                parse_date(due)
+                until = task.get("repeat", {}).get("until")
+                if until and until < due:
+                    raise ValueError(f"Repeat end date {until} is before the due date {due}.")
+                task["due"] = due
+                if "repeat" in task:
+                    task["repeat"]["start"] = due  # Later occurrences follow the moved date
             if tags is not None:
                 task["tags"] = [tag.strip() for tag in tags if tag.strip()]
             
-            save_tasks(tasks)
+            _commit(tasks, changed=[task])
             return task
-    return None
\ No newline at end of file
+    return None
+
+# ---------------------------
+# 📦 Bulk operations
+# ---------------------------
+
+class BulkQuery(TypedDict, total=False):
+    text: str        # Regular expression searched in the task text (case-insensitive)
+    priority: Priority
+    tags: list[str]  # At least one of these tags (case-insensitive)
+    done: bool
+    due_from: str    # Due on or after (YYYY-MM-DD)
+    due_to: str      # Due on or before (YYYY-MM-DD)
+
+class BulkUpdate(TypedDict, total=False):
+    priority: Priority
+    add_tags: list[str]
+    remove_tags: list[str]
+    complete: bool
+    delete: bool
+
+class BulkResult(TypedDict):
+    matched: int
+    scanned: int
+    workers: int
+    seconds: float
+
+# Expected type of each bulk query and update field (lists hold strings)
+BULK_QUERY_FIELDS: dict[str, type] = {
+    "text": str, "priority": str, "tags": list, "done": bool, "due_from": str, "due_to": str,
+}
+BULK_UPDATE_FIELDS: dict[str, type] = {
+    "priority": str, "add_tags": list, "remove_tags": list, "complete": bool, "delete": bool,
+}
+
+def validate_bulk(query: BulkQuery, update: BulkUpdate) -> None:
+    """
+    Raise ValueError if a bulk query or update is invalid.
+    The query needs at least one filter, so a bulk change never hits every
+    task by accident; an empty text pattern selects all tasks explicitly.
+    """
+    for kind, fields, values in (("query", BULK_QUERY_FIELDS, query), ("update", BULK_UPDATE_FIELDS, update)):
+        for key, value in values.items():
+            expected = fields.get(key)
+            if expected is None:
+                raise ValueError(f"Unknown {kind} field: {key}")
+            if not isinstance(value, expected) or (expected is list and not all(isinstance(v, str) for v in value)):
+                name = "list of strings" if expected is list else expected.__name__
+                raise ValueError(f"Field '{key}' of the {kind} must be of type {name}.")
+        if "priority" in values and values["priority"] not in VALID_PRIORITIES:
+            raise ValueError(f"Invalid priority: {values['priority']}. Must be one of {VALID_PRIORITIES}.")
+    if not any(value != [] for value in query.values()):
+        raise ValueError("Nothing to match: set at least one query filter.")
+    if "text" in query:
+        try:
+            re.compile(query["text"])
+        except re.error as e:
+            raise ValueError(f"Invalid text pattern: {e}")
+    for key in ("due_from", "due_to"):
+        if key in query:
+            parse_date(query[key])
+    if not any(update.values()):
+        raise ValueError("Nothing to update: set a priority, add or remove tags, complete or delete.")
+    if update.get("delete") and len([v for v in update.values() if v]) > 1:
+        raise ValueError("Delete can't be combined with other updates.")
+
+def task_matches(task: Task, query: BulkQuery) -> bool:
+    """
+    Return True if a task matches every field set in the query.
+    """
+    if "done" in query and task["done"] != query["done"]:
+        return False
+    if "priority" in query and task["priority"] != query["priority"]:
+        return False
+    if query.get("tags"):
+        task_tags = {tag.lower() for tag in task.get("tags") or []}
+        if not task_tags & {tag.lower() for tag in query["tags"]}:
+            return False
+    if "due_from" in query or "due_to" in query:
+        due = task.get("due") or ""
+        if not due or due < query.get("due_from", "") or due > query.get("due_to", "9999-12-31"):
+            return False
+    if "text" in query and not re.search(query["text"], task["text"], re.IGNORECASE):
+        return False
+    return True
+
+def change_tags(tags: Optional[list[str]], add: Optional[list[str]] = None, remove: Optional[list[str]] = None) -> list[str]:
+    """
+    Return a tag list with `remove` taken out (case-insensitive) and `add` appended once.
+    """
+    removed = {tag.lower() for tag in remove or []}
+    result = [tag for tag in tags or [] if tag.lower() not in removed]
+    result += [tag for tag in add or [] if tag not in result]
+    return result
+
+def _bulk_chunk(
+        tasks: List[Task], query: BulkQuery, update: BulkUpdate,
+) -> tuple[List[Task], List[Task], List[tuple[Task, Task]], List[int]]:
+    """
+    Apply a bulk update to a slice of the task list.
+    Returns (kept tasks, changed tasks, (completed task, its new occurrence
+    without an ID) pairs, deleted IDs).
+    Runs in worker processes, so it only works on its arguments.
+    """
+    kept: List[Task] = []
+    changed: List[Task] = []
+    spawned: List[tuple[Task, Task]] = []
+    removed: List[int] = []
+    for task in tasks:
+        if not task_matches(task, query):
+            kept.append(task)
+            continue
+        if update.get("delete"):
+            removed.append(task["id"])
+            continue
+        if "priority" in update:
+            task["priority"] = update["priority"]
+        if update.get("add_tags") or update.get("remove_tags"):
+            task["tags"] = change_tags(task.get("tags"), update.get("add_tags"), update.get("remove_tags"))
+        if update.get("complete"):
+            upcoming = _mark_done(task)
+            if upcoming is not None:
+                spawned.append((task, upcoming))
+        kept.append(task)
+        changed.append(task)
+    return kept, changed, spawned, removed
+
+@_locked()
+def bulk_update(query: BulkQuery, update: BulkUpdate, workers: int = 1) -> BulkResult:
+    """
+    Apply one update to every task matching a query, with a single save.
+    - By default the whole list is processed in this process.
+    - With `workers` > 1, the list is split into that many contiguous slices
+      processed by a pool of worker processes, and the results are merged
+      in order before saving. Sending tasks to and from the workers costs
+      more than matching them, so this only pays off for expensive queries
+      (e.g. complex text patterns) on very large lists.
+    Returns how many tasks matched, how many were scanned and how long it took.
+    """
+    validate_bulk(query, update)
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"Workers must be a positive integer, got {workers!r}.")
+    started = time.perf_counter()
+    tasks = load_tasks()
+    workers = min(workers, max(1, len(tasks)))
+
+    if workers == 1:
+        parts = [_bulk_chunk(tasks, query, update)]
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # Imported here: it slows down every CLI start
+        size = -(-len(tasks) // workers)  # Ceiling division
+        chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_bulk_chunk, chunks, itertools.repeat(query), itertools.repeat(update)))
+
+    merged: List[Task] = [task for part in parts for task in part[0]]
+    changed: List[Task] = [task for part in parts for task in part[1]]
+    removed: List[int] = [task_id for part in parts for task_id in part[3]]
+    spawned = [pair for part in parts for pair in part[2]]
+    next_id = _next_id(merged, len(spawned)) if spawned else 0
+    for task, upcoming in spawned:
+        upcoming["id"] = task["next_id"] = next_id
+        next_id += 1
+        merged.append(upcoming)
+        changed.append(upcoming)
+
+    if changed or removed:
+        _commit(merged, changed=changed, removed=removed)
+    return {
+        "matched": len(changed) - len(spawned) + len(removed),
+        "scanned": len(tasks),
+        "workers": workers,
+        "seconds": time.perf_counter() - started,
+    }
@@ -8,10 +8,137 @@
 # 📦 Imports
 # ----------------------------------------
 import argparse
+import os
+import shutil
+import sys
 from . import core
-from .utils import print_message, format_task_table, print_task_summary
+from .utils import print_message, format_repeat, format_task_table, print_task_summary, render_task_view, redraw_lines
 from . import __version__
 
+# ----------------------------------------
+# 🔎 List filtering helpers
+# ----------------------------------------
+def filter_tasks(tasks: list[core.Task], args: argparse.Namespace) -> list[core.Task]:
+    """
+    Apply the `list` command filters and sorting to a task list.
+    With a due-date window, recurring tasks are expanded into one row per occurrence.
+    """
+    if args.from_date or args.to_date:
+        start = core.parse_date(args.from_date) if args.from_date else None
+        end = core.parse_date(args.to_date) if args.to_date else None
+        tasks = list(core.expand_occurrences(tasks, start, end))
+
+    # Filter tasks based on command-line arguments
+    if args.done:
+        tasks = [task for task in tasks if task["done"]]
+    elif args.undone:
+        tasks = [task for task in tasks if not task["done"]]
+
+    # Filter by priority if specified
+    if args.priority:
+        tasks = [t for t in tasks if t["priority"] == args.priority]
+
+    # Sort tasks if specified
+    if args.sort == "priority":
+        priority_order = {"high": 0, "medium": 1, "low": 2}
+        tasks.sort(key=lambda t: priority_order.get(t["priority"], 1))
+
+    # Filter by tags if specified
+    if args.tags:
+        requested_tags = {tag.strip().lower() for tag in args.tags.split(",")}
+        filtered_tasks: list[core.Task] = []
+        for t in tasks:
+            tags = t.get("tags") or []
+            task_tags = {tag.lower() for tag in tags}
+            if requested_tags & task_tags:
+                filtered_tasks.append(t)
+        tasks = filtered_tasks
+
+    return tasks
+
+def bulk_request(args: argparse.Namespace) -> tuple[core.BulkQuery, core.BulkUpdate]:
+    """
+    Build the bulk query and update from the `bulk` command arguments.
+    """
+    def split(value: str) -> list[str]:
+        return [t.strip() for t in value.split(",") if t.strip()]
+
+    query: core.BulkQuery = {}
+    if args.match is not None:
+        query["text"] = args.match  # Even empty: `--match ""` selects every task
+    if args.priority:
+        query["priority"] = args.priority
+    if args.tags:
+        query["tags"] = split(args.tags)
+    if args.done or args.undone:
+        query["done"] = args.done
+    if args.from_date:
+        query["due_from"] = args.from_date
+    if args.to_date:
+        query["due_to"] = args.to_date
+
+    update: core.BulkUpdate = {}
+    if args.set_priority:
+        update["priority"] = args.set_priority
+    if args.add_tags:
+        update["add_tags"] = split(args.add_tags)
+    if args.remove_tags:
+        update["remove_tags"] = split(args.remove_tags)
+    if args.complete:
+        update["complete"] = True
+    if args.delete:
+        update["delete"] = True
+    return query, update
+
+def positive_float(value: str) -> float:
+    """
+    argparse type for a number of seconds that must be greater than 0.
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not number > 0:  # Also rejects nan
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+def positive_int(value: str) -> int:
+    """
+    argparse type for a count that must be at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def watch_tasks(args: argparse.Namespace) -> None:
+    """
+    Keep the filtered task list on screen and redraw it when the data file changes.
+    Only rows whose content changed are rewritten. Stops on Ctrl+C.
+    """
+    from .watch import DataFileWatcher  # Only needed in watch mode
+
+    previous: list[str] = []
+    size = shutil.get_terminal_size()
+    with DataFileWatcher(core.DATA_FILE, interval=args.interval) as watcher:
+        try:
+            while True:
+                current = render_task_view(filter_tasks(core.list_tasks(), args), verbose=args.verbose)
+                if shutil.get_terminal_size() != size:
+                    # Rows drawn at the old width may have rewrapped: start over from a clear screen
+                    size = shutil.get_terminal_size()
+                    sys.stdout.write("\x1b[H\x1b[2J")
+                    previous = []
+                sys.stdout.write(redraw_lines(previous, current, size))
+                sys.stdout.flush()
+                previous = current
+                watcher.wait()
+        except KeyboardInterrupt:
+            print()
+
 # ----------------------------------------
 # 📝 Main function to handle CLI commands
 # ----------------------------------------
@@ -23,6 +150,11 @@ def main():
     parser.add_argument(
     "--version", "-v", action="version", version=f"todo-cli-x v{__version__}"
     )
+    parser.add_argument(
+        "--server",
+        default=os.environ.get("TODO_SERVER"),
+        help="Use a `todo serve` sync server (e.g. 192.168.1.10:8765) instead of the local file (env: TODO_SERVER, token: TODO_SERVER_TOKEN)"
+    )
 
     subparsers = parser.add_subparsers(dest="command", title="Available commands", metavar="")
 
@@ -45,6 +177,21 @@ def main():
         type=str,
         help="Set tags for the task, comma-separated (e.g., work,urgent) - optional"
     )
+    add_parser.add_argument(
+        "--repeat",
+        choices=["daily", "weekly", "monthly"],
+        help="Make the task recurring; the due date (default: today) is the first occurrence"
+    )
+    add_parser.add_argument(
+        "--every",
+        type=int,
+        help="Repeat every N days/weeks/months (default: 1) - used with --repeat"
+    )
+    add_parser.add_argument(
+        "--until",
+        type=str,
+        help="Last date a recurring task may fall on (format: YYYY-MM-DD) - optional"
+    )
 
     # === list command ===
     list_parser = subparsers.add_parser("list", help="List all tasks", description="List all tasks in your todo list with optional filters and sorting.")
@@ -78,8 +225,46 @@ def main():
         action="store_true",
         help="Show detailed task information like creation date and time"
     )
+    list_parser.add_argument(
+        "--from",
+        dest="from_date",
+        type=str,
+        help="Show tasks due on or after this date, expanding recurring tasks (format: YYYY-MM-DD)"
+    )
+    list_parser.add_argument(
+        "--to",
+        dest="to_date",
+        type=str,
+        help="Show tasks due on or before this date, expanding recurring tasks (format: YYYY-MM-DD)"
+    )
+    list_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Stay open and redraw the list whenever the data file changes (Ctrl+C to exit)"
+    )
+    list_parser.add_argument(
+        "--interval",
+        type=positive_float,
+        default=1.0,
+        help="Polling interval in seconds for --watch when inotify is unavailable (default: 1.0)"
+    )
 
 
+    # === next command ===
+    next_parser = subparsers.add_parser("next", help="Show the next tasks to work on", description="Show the top open tasks by priority, then due date, then age.")
+    next_parser.add_argument(
+        "-n",
+        dest="count",
+        type=int,
+        default=1,
+        help="Number of tasks to show (default: 1)"
+    )
+    next_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show detailed task information like creation date and time"
+    )
+
     # === complete command ===
     complete_parser = subparsers.add_parser("complete", help="Mark a task as completed")
     complete_parser.add_argument("id", type=int, help="ID of the task to complete")
@@ -99,6 +284,29 @@ def main():
     edit_parser.add_argument("--due", type=str, help="New due date (format: YYYY-MM-DD)")
     edit_parser.add_argument("--tags", type=str, help="New tags, comma-separated (e.g. work,urgent)")
 
+    # === bulk command ===
+    bulk_parser = subparsers.add_parser("bulk", help="Update every task matching a query", description="Apply one update to all tasks matching a query, in a single pass and a single save.")
+    bulk_query = bulk_parser.add_argument_group("query (tasks must match all given filters)")
+    bulk_query.add_argument("--match", type=str, help="Regular expression searched in the task text (case-insensitive)")
+    bulk_query.add_argument("--priority", choices=["low", "medium", "high"], help="Only tasks with this priority")
+    bulk_query.add_argument("--tags", type=str, help="Only tasks with at least one of these tags, comma-separated")
+    bulk_query.add_argument("--done", action="store_true", help="Only completed tasks")
+    bulk_query.add_argument("--undone", action="store_true", help="Only uncompleted tasks")
+    bulk_query.add_argument("--from", dest="from_date", type=str, help="Only tasks due on or after this date (format: YYYY-MM-DD)")
+    bulk_query.add_argument("--to", dest="to_date", type=str, help="Only tasks due on or before this date (format: YYYY-MM-DD)")
+    bulk_update = bulk_parser.add_argument_group("update")
+    bulk_update.add_argument("--set-priority", choices=["low", "medium", "high"], help="Set the priority")
+    bulk_update.add_argument("--add-tags", type=str, help="Add tags, comma-separated")
+    bulk_update.add_argument("--remove-tags", type=str, help="Remove tags, comma-separated")
+    bulk_update.add_argument("--complete", action="store_true", help="Mark as completed")
+    bulk_update.add_argument("--delete", action="store_true", help="Delete the tasks")
+    bulk_parser.add_argument("--workers", type=positive_int, default=1, help="Worker processes; only helps with costly --match patterns on very large lists (default: 1)")
+
+    # === serve command ===
+    serve_parser = subparsers.add_parser("serve", help="Share the task file over the network", description="Serve the local task file to other machines running `todo --server`.")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1). Before using 0.0.0.0 (all interfaces), set TODO_SERVER_TOKEN: without it anyone who can reach the port can read and change your tasks")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+
     args = parser.parse_args()
 
 # ----------------------------------------
@@ -114,20 +322,60 @@ This is a simple and minimalist command-line todo manager.
 
 📦 Available commands:
 • todo add "Task content" [--priority low|medium|high] [--due YYYY-MM-DD] [--tags tag1,tag2]      ➜ Add a new task with optional priority (default: medium) and due date
-• todo list [--done | --undone] [--priority ...] [--tags work,urgent] [--sort priority]           ➜ List tasks with optional filters and sorting
+  [--repeat daily|weekly|monthly] [--every N] [--until YYYY-MM-DD]                                ➜ Make it a recurring task
+• todo list [--done | --undone] [--priority ...] [--tags work,urgent] [--sort priority] [--watch] ➜ List tasks with optional filters and sorting
+  [--from YYYY-MM-DD] [--to YYYY-MM-DD]                                                           ➜ Show due dates in a window, expanding recurring tasks
+• todo next [-n K]                                                                                ➜ Show the K next tasks by priority, due date and age
 • todo complete <id>                                                                              ➜ Mark a task as completed by ID
 • todo delete <id>                                                                                ➜ Delete a task by ID
 • todo edit <id> [--text ...] [--priority low|medium|high] [--due YYYY-MM-DD] [--tags tag1,tag2]  ➜ Edit an existing task
+• todo bulk [--match TEXT] [--tags ...] [--from/--to ...] [--set-priority ...] [--complete] ...   ➜ Update every task matching a query at once
 • todo clear                                                                                      ➜ Delete all tasks
+• todo serve [--host HOST] [--port PORT]                                                          ➜ Share this task file with other machines
+• todo --server HOST:PORT <command>                                                               ➜ Run a command against a `todo serve` server
 
 ℹ️  Run `todo --help` for more details.
         """)
         return
 
+    # Use the sync server when one is configured, the local file otherwise.
+    # The network modules are only imported when needed: they slow down every start.
+    remote = bool(args.server) and args.command != "serve"
+    try:
+        store = core
+        if remote:
+            from .client import RemoteStore
+            store = RemoteStore(args.server, token=os.environ.get("TODO_SERVER_TOKEN"))
+        run_command(args, store)
+    except OSError as e:  # Refused, timed out, unknown host...
+        if not remote:
+            raise
+        print_message("error", f"Could not reach the sync server at {args.server}: {e}")
+    except ValueError as e:  # Bad address, request refused by the server, not a sync server
+        if not remote:
+            raise
+        print_message("error", str(e))
+
+# ----------------------------------------
+# 🚦 Command dispatch
+# ----------------------------------------
+def run_command(args: argparse.Namespace, store) -> None:
+    """
+    Run the parsed command against a task store: the `core` module or a RemoteStore.
+    """
     # Add command handling
     if args.command == "add":
         tags = [t.strip() for t in args.tags.split(",")] if args.tags else []
-        task = core.add_task(args.text, priority=args.priority, due=args.due, tags=tags)
+        if (args.every is not None or args.until) and not args.repeat:
+            print_message("error", "--every and --until only apply to recurring tasks: add --repeat.")
+            return
+        try:
+            every = args.every if args.every is not None else 1
+            repeat = core.make_repeat(args.repeat, every, args.until) if args.repeat else None
+            task = store.add_task(args.text, priority=args.priority, due=args.due, tags=tags, repeat=repeat)
+        except ValueError as e:
+            print_message("error", str(e))
+            return
         if task:
             meta_parts = [f"priority: {task['priority']}"]
             if task.get("due"):
@@ -137,6 +385,8 @@ This is a simple and minimalist command-line todo manager.
             if task.get("tags"):
                 tags_str = ", ".join(tags)
                 meta_parts.append(f"tags: {tags_str}")
+            if task.get("repeat"):
+                meta_parts.append(f"repeat: {format_repeat(task.get('repeat'))}")
 
             meta_str = " ".join(f"({part})" for part in meta_parts)
 
@@ -146,8 +396,6 @@ This is a simple and minimalist command-line todo manager.
 
     # List command handling
     elif args.command == "list":
-        tasks = core.list_tasks()
-
         # Check if there are any tasks to display
         if args.done and args.undone:
             print_message("warning", "You can't use --done and --undone together.")
@@ -155,31 +403,24 @@ This is a simple and minimalist command-line todo manager.
             print_message("info", "Please choose one of them to filter tasks.")
             return
         
-        # Filter tasks based on command-line arguments
-        if args.done:
-            tasks = [task for task in tasks if task["done"]]
-        elif args.undone:
-            tasks = [task for task in tasks if not task["done"]]
-
-        # Filter by priority if specified
-        if args.priority:
-            tasks = [t for t in tasks if t["priority"] == args.priority]
-
-        # Sort tasks if specified
-        if args.sort == "priority":
-            priority_order = {"high": 0, "medium": 1, "low": 2}
-            tasks.sort(key=lambda t: priority_order.get(t["priority"], 1))
-
-        # Filter by tags if specified
-        if args.tags:
-            requested_tags = {tag.strip().lower() for tag in args.tags.split(",")}
-            filtered_tasks: list[core.Task] = []
-            for t in tasks:
-                tags = t.get("tags") or []
-                task_tags = {tag.lower() for tag in tags}
-                if requested_tags & task_tags:
-                    filtered_tasks.append(t)
-            tasks = filtered_tasks
+        # Validate the due-date window up front
+        try:
+            for value in (args.from_date, args.to_date):
+                if value:
+                    core.parse_date(value)
+        except ValueError as e:
+            print_message("error", str(e))
+            return
+
+        # Watch mode stays resident and redraws on every data file change
+        if args.watch:
+            if args.server:
+                print_message("error", "--watch only works with the local task file.")
+                return
+            watch_tasks(args)
+            return
+
+        tasks = filter_tasks(store.list_tasks(), args)
 
         # If no tasks match the filters, show a message
         if not tasks:
@@ -188,23 +429,37 @@ This is a simple and minimalist command-line todo manager.
             print(format_task_table(tasks, verbose=args.verbose))
             print_task_summary(tasks)
 
+    # Next command handling
+    elif args.command == "next":
+        try:
+            tasks = store.next_tasks(args.count)
+        except ValueError as e:
+            print_message("error", str(e))
+            return
+        if not tasks:
+            print_message("info", "No open tasks.")
+        else:
+            print(format_task_table(tasks, verbose=args.verbose))
+
     # Complete command handling
     elif args.command == "complete":
-        task = core.complete_task(args.id)
+        task = store.complete_task(args.id)
         if task:
             print_message("success", f'Task [{task["id"]}] "{task["text"]}" marked as done!')
+            if "next_id" in task:
+                print_message("info", f'Next occurrence due {core.next_occurrence(task)} as task [{task["next_id"]}].')
         else:
             print_message("error", f"Sorry, task [{args.id}] not found.")
 
     # Clear command handling
     elif args.command == "clear":
-        core.clear_tasks()
+        store.clear_tasks()
         print_message("info", "All tasks cleared.")
 
     # Delete command handling
     elif args.command == "delete":
-        for task_id in args.ids:
-            task = core.delete_task(task_id)
+        # One save (or one request with --server) for all IDs
+        for task_id, task in zip(args.ids, store.delete_tasks(args.ids)):
             if task:
                 print_message("delete", f'Task [{task["id"]}] "{task["text"]}" deleted.')
             else:
@@ -216,7 +471,7 @@ This is a simple and minimalist command-line todo manager.
         tags = [t.strip() for t in args.tags.split(",") if t.strip()] if args.tags else None
 
         try:
-            updated = core.edit_task(
+            updated = store.edit_task(
                 task_id=args.id,
                 text=args.text,
                 priority=args.priority,
@@ -232,6 +487,37 @@ This is a simple and minimalist command-line todo manager.
         else:
             print_message("error", f"Task [{args.id}] not found.")
 
+    # Bulk command handling
+    elif args.command == "bulk":
+        if args.done and args.undone:
+            print_message("warning", "You can't use --done and --undone together.")
+            return
+        query, update = bulk_request(args)
+        try:
+            result = store.bulk_update(query, update, workers=args.workers)
+        except ValueError as e:
+            print_message("error", str(e))
+            return
+        rate = result["scanned"] / result["seconds"] if result["seconds"] else 0
+        plural = "s" if result["matched"] != 1 else ""
+        print_message(
+            "success",
+            f'{result["matched"]} task{plural} updated ({result["scanned"]} scanned in {result["seconds"]:.2f}s, '
+            f'{rate:,.0f} tasks/s, {result["workers"]} worker{"s" if result["workers"] != 1 else ""})'
+        )
+
+    # Serve command handling
+    elif args.command == "serve":
+        token = os.environ.get("TODO_SERVER_TOKEN")
+        print_message("info", f"Serving {os.path.abspath(core.DATA_FILE)} on http://{args.host}:{args.port} (Ctrl+C to stop)")
+        if not token and args.host not in ("127.0.0.1", "localhost", "::1"):
+            print_message("warning", "TODO_SERVER_TOKEN is not set: anyone who can reach this port can read and change your tasks.")
+        try:
+            from .server import serve
+            serve(args.host, args.port, token=token)
+        except KeyboardInterrupt:
+            print()
+
     # If command is not recognized
     else:
         print_message("error", "Unknown command. Use `todo --help` to see available commands.")
\ No newline at end of file
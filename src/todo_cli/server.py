@@ -0,0 +1,310 @@
+# ----------------------------------------
+# 🌐 Sync Server Module for Todo CLI X
+# Serves one task store over HTTP/JSON so several machines can share it.
+# Built on asyncio and the standard library only. All changes go through
+# this single process, which applies them one at a time with `core`
+# and tracks a revision number per task for delta-based sync.
+# ----------------------------------------
+
+import asyncio
+import hmac
+import json
+import traceback
+import uuid
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from . import core
+
+# ----------------------------------------
+# 📡 Protocol
+# ----------------------------------------
+# GET  /sync?since=REV&epoch=EPOCH
+# POST /batch  {"ops": [...], "since": REV, "epoch": EPOCH}
+#
+# Both answer with a sync delta:
+# {"epoch": str, "revision": int, "full": bool, "tasks": [...], "deleted": [ids]}
+# and /batch adds {"results": [...]}, one {"ok": value} or {"error": message}
+# per operation. Operations are add, complete, delete, edit, clear (same
+# fields as the `core` functions) and bulk ({"query": ..., "update": ...}).
+#
+# Each task carries the revision at which it last changed ("rev"). A client
+# that sends the epoch and revision of its last sync only receives tasks and
+# deletions newer than that. A new epoch is picked on every server start,
+# which forces clients to do one full sync.
+#
+# A server started with a token answers 401 to any request without an
+# "Authorization: Bearer TOKEN" header carrying it. The token is sent in
+# clear text: it keeps other users of a trusted network out, it does not
+# protect against anyone able to read the traffic.
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+class BadRequest(Exception):
+    pass
+
+# Fields each batch operation accepts, with their JSON type; None is allowed for optional ones
+OPERATIONS: dict[str, dict[str, type]] = {
+    "add": {"text": str, "priority": str, "due": str, "tags": list, "repeat": dict},
+    "complete": {"id": int},
+    "delete": {"id": int},
+    "edit": {"id": int, "text": str, "priority": str, "due": str, "tags": list},
+    "clear": {},
+    "bulk": {"query": dict, "update": dict},
+}
+REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+    "add": ("text",), "complete": ("id",), "delete": ("id",), "edit": ("id",), "bulk": ("query", "update"),
+}
+
+def check_op(op: Any) -> None:
+    """
+    Raise BadRequest unless `op` is a well-formed batch operation.
+    Only the shape is checked here: values (dates, priorities...) are
+    validated by `core` when the operation is applied.
+    """
+    if not isinstance(op, dict):
+        raise BadRequest("Each operation must be a JSON object.")
+    kind = op.get("op")
+    if kind not in OPERATIONS:
+        raise BadRequest(f"Unknown operation: {kind}")
+    for field, expected in OPERATIONS[kind].items():
+        value = op.get(field)
+        if value is None:
+            if field in REQUIRED_FIELDS.get(kind, ()):
+                raise BadRequest(f"Operation '{kind}' needs a '{field}' field.")
+            continue
+        # bool is an int subclass, but never a valid ID
+        if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise BadRequest(f"Field '{field}' of '{kind}' must be of type {expected.__name__}.")
+    if not all(isinstance(tag, str) for tag in op.get("tags") or []):
+        raise BadRequest("Tags must be strings.")
+    if op.get("repeat") is not None:
+        repeat = op["repeat"]
+        try:
+            core.make_repeat(repeat.get("frequency"), repeat.get("interval", 1), repeat.get("until"))
+        except (ValueError, TypeError) as e:
+            raise BadRequest(f"Invalid repeat rule: {e}")
+    if kind == "bulk":
+        try:
+            core.validate_bulk(op["query"], op["update"])
+        except (ValueError, TypeError) as e:
+            raise BadRequest(f"Invalid bulk request: {e}")
+
+# ----------------------------------------
+# 🗃️ Revision-tracked store
+# ----------------------------------------
+
+class SyncStore:
+    """
+    Wrap the `core` store with per-task revision numbers and deletion tombstones.
+    Changes are detected by diffing the task list after each batch, so changes
+    made to the data file by other programs are picked up as well.
+    """
+
+    def __init__(self) -> None:
+        self.epoch = uuid.uuid4().hex
+        self.revision = 0
+        self.tasks: dict[int, core.Task] = {}
+        self.revs: dict[int, int] = {}
+        self.tombstones: dict[int, int] = {}
+        self._signature: Any = None
+        self.refresh()
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Reload the data file if it changed and bump the revision of changed tasks.
+        """
+        signature = core.file_signature(core.DATA_FILE)
+        if signature == self._signature and not force:
+            return
+        current = {t["id"]: t for t in core.load_tasks()}
+        changed = [task_id for task_id, task in current.items() if self.tasks.get(task_id) != task]
+        removed = [task_id for task_id in self.tasks if task_id not in current]
+        if changed or removed:
+            self.revision += 1
+        for task_id in changed:
+            self.revs[task_id] = self.revision
+            self.tombstones.pop(task_id, None)
+        for task_id in removed:
+            self.revs.pop(task_id, None)
+            self.tombstones[task_id] = self.revision
+        self.tasks = current
+        self._signature = signature
+
+    def delta(self, since: int, epoch: Optional[str]) -> dict[str, Any]:
+        """
+        Return the tasks and deletions newer than `since`, or a full snapshot
+        if the client last synced against another epoch.
+        """
+        full = epoch != self.epoch
+        if full:
+            since = -1
+        return {
+            "epoch": self.epoch,
+            "revision": self.revision,
+            "full": full,
+            "tasks": [{**t, "rev": self.revs[i]} for i, t in self.tasks.items() if self.revs[i] > since],
+            "deleted": [] if full else [i for i, rev in self.tombstones.items() if rev > since],
+        }
+
+    def apply(self, op: dict[str, Any]) -> Any:
+        """
+        Apply one batch operation, already checked with check_op(), with `core`
+        and return its JSON-ready result.
+        """
+        kind = op["op"]
+        if kind == "add":
+            return core.add_task(
+                op["text"],
+                priority=op.get("priority", "medium"),
+                due=op.get("due"),
+                tags=op.get("tags"),
+                repeat=op.get("repeat"),
+            )
+        if kind == "complete":
+            return core.complete_task(op["id"])
+        if kind == "delete":
+            return core.delete_task(op["id"])
+        if kind == "edit":
+            return core.edit_task(
+                op["id"],
+                text=op.get("text"),
+                priority=op.get("priority"),
+                due=op.get("due"),
+                tags=op.get("tags"),
+            )
+        if kind == "clear":
+            core.clear_tasks()
+            return None
+        if kind == "bulk":
+            # Matched and changed here, against the current store, so concurrent changes are kept
+            return core.bulk_update(op["query"], op["update"], workers=1)
+        raise ValueError(f"Unknown operation: {kind}")
+
+    def batch(self, ops: list[dict[str, Any]]) -> list[Any]:
+        """
+        Apply operations in order. A failing operation reports its error
+        without stopping the rest of the batch.
+        """
+        self.refresh()
+        results: list[Any] = []
+        for op in ops:
+            try:
+                results.append({"ok": self.apply(op)})
+            except (ValueError, KeyError, TypeError) as e:
+                results.append({"error": str(e) if not isinstance(e, KeyError) else f"Missing field: {e}"})
+        self.refresh(force=True)
+        return results
+
+# ----------------------------------------
+# 🔌 HTTP handling
+# ----------------------------------------
+
+class SyncServer:
+    """
+    Minimal HTTP/1.1 server with keep-alive, answering JSON requests.
+    Requests are handled one at a time on the event loop, so writes
+    to the data file never overlap. With a `token`, only requests
+    carrying it are answered.
+    """
+
+    def __init__(self, token: Optional[str] = None) -> None:
+        self.store = SyncStore()
+        self.token = token
+
+    def authorized(self, headers: dict[str, str]) -> bool:
+        if not self.token:
+            return True
+        expected = f"Bearer {self.token}".encode("utf-8")
+        # Constant-time comparison, so the token can't be guessed from response times
+        return hmac.compare_digest(headers.get("authorization", "").encode("latin-1"), expected)
+
+    def dispatch(self, method: str, target: str, body: bytes) -> tuple[int, Any]:
+        url = urlsplit(target)
+        if url.path == "/sync":
+            if method != "GET":
+                return 405, {"error": "Use GET for /sync."}
+            query = parse_qs(url.query)
+            since = int(query.get("since", ["0"])[0])
+            epoch = query.get("epoch", [None])[0]
+            self.store.refresh()
+            return 200, self.store.delta(since, epoch)
+        if url.path == "/batch":
+            if method != "POST":
+                return 405, {"error": "Use POST for /batch."}
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise BadRequest("Request body must be a JSON object.")
+            ops = request.get("ops")
+            if not isinstance(ops, list):
+                raise BadRequest("Field 'ops' must be a list.")
+            since, epoch = request.get("since", 0), request.get("epoch")
+            if not isinstance(since, int) or not isinstance(epoch, (str, type(None))):
+                raise BadRequest("Fields 'since' and 'epoch' must be an integer and a string.")
+            # Reject the whole batch before applying anything if one operation is malformed
+            for op in ops:
+                check_op(op)
+            results = self.store.batch(ops)
+            response = self.store.delta(since, epoch)
+            response["results"] = results
+            return 200, response
+        return 404, {"error": f"Unknown path: {url.path}"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split()
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+                try:
+                    if self.authorized(headers):
+                        status, payload = self.dispatch(method, target, body)
+                    else:
+                        status, payload = 401, {"error": "Missing or wrong token: set TODO_SERVER_TOKEN to the server's token."}
+                except (BadRequest, ValueError) as e:
+                    status, payload = 400, {"error": str(e)}
+                except Exception as e:
+                    # A bug must not drop the connection without an answer or stop the server
+                    traceback.print_exc()
+                    status, payload = 500, {"error": f"Internal server error: {e}"}
+
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass  # Malformed request or client went away
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.Server:
+        return await asyncio.start_server(self.handle, host, port)
+
+def serve(host: str = "127.0.0.1", port: int = 8765, token: Optional[str] = None) -> None:
+    """
+    Run the sync server until interrupted.
+    """
+    async def main() -> None:
+        server = await SyncServer(token).start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
@@ -3,16 +3,19 @@
 # Contains reusable helpers for printing messages and formatting output.
 # ----------------------------------------
 
-from typing import List
-from .core import TaskDict
+import os
+import shutil
+import unicodedata
+from typing import List, Optional
+from .core import RepeatDict, TaskDict
 
 # -------------------------------
 # 🎨 Message display utility
 # -------------------------------
 
-def print_message(kind: str, message: str) -> None:
+def format_message(kind: str, message: str) -> str:
     """
-    Print a message with a contextual icon prefix.
+    Return a message with a contextual icon prefix.
     Supported kinds: success, delete, error, warning, info
     """
     icons = {
@@ -23,8 +26,34 @@ def print_message(kind: str, message: str) -> None:
         "info": "ℹ️",
     }
     prefix = icons.get(kind, "")
-    print(f"{prefix}  {message.lstrip()}")  # Extra space for better UX
+    return f"{prefix}  {message.lstrip()}"  # Extra space for better UX
+
+def print_message(kind: str, message: str) -> None:
+    """
+    Print a message with a contextual icon prefix.
+    """
+    print(format_message(kind, message))
+
 
+# -------------------------------
+# 🔁 Recurrence formatter
+# -------------------------------
+
+def format_repeat(repeat: Optional[RepeatDict]) -> str:
+    """
+    Return a short human-readable description of a recurrence rule,
+    e.g. "weekly", "every 3 days until 2025-12-31". Empty if no rule.
+    """
+    if not repeat:
+        return ""
+    units = {"daily": "day", "weekly": "week", "monthly": "month"}
+    if repeat["interval"] == 1:
+        text = repeat["frequency"]
+    else:
+        text = f"every {repeat['interval']} {units[repeat['frequency']]}s"
+    if repeat.get("until"):
+        text += f" until {repeat['until']}"
+    return text
 
 # -------------------------------
 # 📋 Task table formatter
@@ -33,14 +62,14 @@ def print_message(kind: str, message: str) -> None:
 def format_task_table(tasks: List[TaskDict], verbose: bool = False) -> str:
     """
     Return a formatted string displaying tasks in a table layout.
-    Columns: ID | Status | Priority | Task | Due [| Created | Tags]
+    Columns: ID | Status | Priority | Task | Due [| Created | Tags | Repeat]
     """
     if not tasks:
         return "⚠️  No tasks to display."
 
     headers = ["ID", "Status", "Priority", "Task", "Due"]
     if verbose:
-        headers.extend(["Created", "Tags"])
+        headers.extend(["Created", "Tags", "Repeat"])
 
     rows: List[List[str]] = []
     for task in tasks:
@@ -57,6 +86,7 @@ def format_task_table(tasks: List[TaskDict], verbose: bool = False) -> str:
             tags = task.get("tags")
             tags_str = ", ".join(tags) if tags else ""
             row.append(tags_str)
+            row.append(format_repeat(task.get("repeat")))
         rows.append(row)
 
     # Determine column widths
@@ -82,19 +112,80 @@ def format_task_table(tasks: List[TaskDict], verbose: bool = False) -> str:
 # 📊 Task summary printer
 # -------------------------------
 
-def print_task_summary(tasks: List[TaskDict]) -> None:
+def format_task_summary(tasks: List[TaskDict]) -> str:
     """
-    Print a summary of task statistics: total, completed, and remaining.
+    Return a one-line summary of task statistics: total, completed, and remaining.
     """
     total = len(tasks)
     done = sum(1 for t in tasks if t["done"])
     left = total - done
     plural = "s" if total != 1 else ""
+    return f"{total} task{plural} — {done} completed, {left} remaining"
 
-    if total == 0:
+def print_task_summary(tasks: List[TaskDict]) -> None:
+    """
+    Print a summary of task statistics: total, completed, and remaining.
+    """
+    if not tasks:
         print_message("info", "No tasks available.")
         return
 
     # Spacing for readability
     print()
-    print_message("info", f"{total} task{plural} — {done} completed, {left} remaining")
\ No newline at end of file
+    print_message("info", format_task_summary(tasks))
+
+# -------------------------------
+# 🔁 Incremental redraw (watch mode)
+# -------------------------------
+
+def render_task_view(tasks: List[TaskDict], verbose: bool = False) -> List[str]:
+    """
+    Return the lines shown by `todo list`: the task table followed by the summary.
+    """
+    if not tasks:
+        return [format_message("info", "No tasks found.")]
+    lines = format_task_table(tasks, verbose=verbose).splitlines()
+    lines.append("")
+    lines.append(format_message("info", format_task_summary(tasks)))
+    return lines
+
+def crop_line(line: str, width: int) -> str:
+    """
+    Cut a line to at most `width` terminal columns, counting wide characters
+    (emoji, CJK) as two columns, so it never wraps onto the next row.
+    """
+    used = 0
+    for i, char in enumerate(line):
+        used += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+        if used > width:
+            return line[:i]
+    return line
+
+def redraw_lines(previous: List[str], current: List[str], size: Optional[os.terminal_size] = None) -> str:
+    """
+    Return the terminal output that turns `previous` into `current` in place.
+    Assumes the cursor sits just below the previously drawn lines.
+    Unchanged rows are skipped over, changed rows are cleared and rewritten,
+    and leftover rows from a longer previous view are erased.
+    Lines are cropped to the terminal width. If either view is taller than the
+    terminal, moving back up can't reach its first row: the screen is cleared
+    and redrawn from the top instead, showing as many rows as fit.
+    """
+    columns, rows = size or shutil.get_terminal_size()
+    width = max(1, columns - 1)  # Writing to the last column may wrap on some terminals
+    out: List[str] = []
+    if len(previous) >= rows or len(current) >= rows:
+        out.append("\x1b[H\x1b[2J")  # Cursor home, clear the screen
+        out.extend(f"{crop_line(line, width)}\n" for line in current[:rows - 1])
+        return "".join(out)
+
+    if previous:
+        out.append(f"\x1b[{len(previous)}F")  # Back to the start of the first drawn line
+    for i, line in enumerate(current):
+        if i < len(previous) and previous[i] == line:
+            out.append("\n")
+        else:
+            out.append(f"\x1b[2K{crop_line(line, width)}\n")
+    if len(current) < len(previous):
+        out.append("\x1b[J")  # Erase rows that no longer exist
+    return "".join(out)
@@ -0,0 +1,119 @@
+# ----------------------------------------
+# 👀 Watch Module for Todo CLI X
+# Waits for changes to the task data file so `todo list --watch`
+# can stay resident instead of being relaunched every second.
+# Uses inotify on Linux and falls back to a cheap stat-based poll.
+# ----------------------------------------
+
+import os
+import select
+import sys
+import time
+from typing import Optional
+from .core import file_signature
+
+# ----------------------------------------
+# 🐧 Optional inotify support (Linux only, via libc)
+# ----------------------------------------
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0x00000800
+_IN_CLOEXEC = 0x00080000
+
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+_libc = None
+if sys.platform.startswith("linux"):
+    try:
+        import ctypes
+        import ctypes.util
+
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        _libc.inotify_init1  # Raises AttributeError if libc has no inotify
+        _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        _libc = None
+
+# ----------------------------------------
+# 🔔 Data file watcher
+# ----------------------------------------
+
+class DataFileWatcher:
+    """
+    Block until a file changes, with near-zero idle CPU.
+    - With inotify, sleeps in select() on the parent directory's events.
+    - Without it, polls os.stat() every `interval` seconds.
+    A wake-up only counts as a change if the file signature actually differs,
+    so unrelated events in the same directory never trigger a reload.
+    """
+
+    def __init__(self, path: str, interval: float = 1.0, use_inotify: bool = True) -> None:
+        if not interval > 0:
+            raise ValueError("Polling interval must be greater than 0.")
+        self.path = path
+        self.interval = interval
+        self._last = file_signature(path)
+        self._fd: Optional[int] = None
+        if use_inotify and _libc is not None:
+            self._fd = self._open_inotify()
+
+    def _open_inotify(self) -> Optional[int]:
+        assert _libc is not None
+        fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        # Watch the directory: atomic saves replace the file, which would drop a file watch
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if _libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the file changes.
+        Returns True on change, False if `timeout` seconds elapsed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._fd is not None:
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+                if ready:
+                    self._drain()
+            else:
+                time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+            current = file_signature(self.path)
+            if current != self._last:
+                self._last = current
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def _drain(self) -> None:
+        # We only care that something happened, so the event payload is discarded
+        assert self._fd is not None
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "DataFileWatcher":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,272 @@
+# ----------------------------------------------------------
+# 🔥 Stress harness for the storage layer (core.py)
+# Runs random interleavings of add, edit, complete, delete, list and clear
+# from many processes against one (optionally large) task file. Workers
+# change any task, not just their own, and clear the whole list while the
+# others keep writing. It then checks invariants that hold under any of
+# these races:
+# - the file is always parseable and its IDs unique, even while it is being written
+# - no ID is handed out twice, and a task keeps the ID it was added with
+# - no task added after the last clear goes missing, unless a worker deleted it
+# - a deleted task never comes back, a completed task is never reopened
+# - a task's priority and tags are those of one of its edits, or unchanged if never edited
+# It also reports operations per second and latency percentiles per operation.
+#
+# Used by tests/test_stress.py with small settings. For a real load test:
+#   python tests/stress_harness.py --processes 16 --ops 500 --prefill 50000
+# ----------------------------------------------------------
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Optional
+
+from todo_cli import core
+
+OPERATIONS = ("add", "edit", "complete", "delete", "list", "clear")
+WEIGHTS = (40, 25, 15, 15, 4, 1)
+
+# Shared with the workers when the pool starts (synchronized values can't be sent with each task)
+_clears: Any = None   # Number of clears completed so far
+_high_id: Any = None  # Highest task ID handed out so far
+
+def init_worker(clears: Any, high_id: Any) -> None:
+    global _clears, _high_id
+    _clears, _high_id = clears, high_id
+
+# -------------------------------
+# 👷 Worker process
+# -------------------------------
+def worker(worker_id: int, data_file: str, ops: int, seed: int) -> dict[str, Any]:
+    """
+    Run `ops` random operations on any task of the store.
+    Every add records how many clears had completed before it started: if
+    that is still the total at the end, no clear can have removed the task.
+    A clear is counted only once it has returned, so the check errs on the
+    side of skipping tasks, never of reporting a task wrongly.
+    Every edit records the priority and tags it left on the task.
+    """
+    core.DATA_FILE = data_file
+    rng = random.Random(seed)
+    added: list[tuple[int, str, str, int]] = []  # (ID, text, priority, clears completed before the add)
+    edited: list[tuple[str, str, list[str]]] = []  # (text, priority, tags)
+    deleted: list[str] = []
+    completed: list[str] = []
+    latencies: dict[str, list[float]] = {op: [] for op in OPERATIONS}
+    errors: list[str] = []
+
+    for n in range(ops):
+        op = rng.choices(OPERATIONS, WEIGHTS)[0]
+        task_id = rng.randint(1, max(1, _high_id.value))
+        started = time.perf_counter()
+
+        if op == "add":
+            clears_before = _clears.value
+            task = core.add_task(f"w{worker_id}-{n}", priority=rng.choice(core.VALID_PRIORITIES))
+            added.append((task["id"], task["text"], task["priority"], clears_before))
+            with _high_id.get_lock():
+                _high_id.value = max(_high_id.value, task["id"])
+        elif op == "edit":
+            task = core.edit_task(task_id, priority=rng.choice(core.VALID_PRIORITIES), tags=[f"w{worker_id}", f"e{n}"])
+            if task is not None:
+                edited.append((task["text"], task["priority"], task["tags"]))
+        elif op == "complete":
+            task = core.complete_task(task_id)
+            if task is not None:
+                completed.append(task["text"])
+        elif op == "delete":
+            task = core.delete_task(task_id)
+            if task is not None:
+                deleted.append(task["text"])
+        elif op == "list":
+            ids = [t["id"] for t in core.list_tasks()]
+            if len(ids) != len(set(ids)):
+                errors.append(f"list by worker {worker_id} returned duplicate IDs")
+        else:
+            core.clear_tasks()
+            with _clears.get_lock():
+                _clears.value += 1
+
+        latencies[op].append(time.perf_counter() - started)
+
+    return {
+        "added": added, "edited": edited, "deleted": deleted, "completed": completed,
+        "latencies": latencies, "errors": errors,
+    }
+
+# -------------------------------
+# 👀 Reader process
+# -------------------------------
+def reader(data_file: str, stop: Any, failures: Any, reads: Any) -> None:
+    """
+    Parse the raw data file in a loop until stopped, counting reads that
+    fail to parse or hold duplicate IDs.
+    """
+    while not stop.is_set():
+        try:
+            with open(data_file, "r", encoding="utf-8") as f:
+                ids = [t["id"] for t in json.load(f)]
+            if len(ids) != len(set(ids)):
+                raise ValueError("duplicate IDs")
+        except FileNotFoundError:
+            pass
+        except ValueError:  # Includes JSONDecodeError and UnicodeDecodeError
+            with failures.get_lock():
+                failures.value += 1
+        with reads.get_lock():
+            reads.value += 1
+
+# -------------------------------
+# 📏 Invariant checks
+# -------------------------------
+def check_store(data_file: str, results: list[dict[str, Any]], clears: int) -> list[str]:
+    """
+    Return a list of invariant violations found in the final data file.
+    """
+    violations: list[str] = []
+    try:
+        with open(data_file, "r", encoding="utf-8") as f:
+            tasks = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        return [f"final file is not readable: {e}"]
+
+    ids = [t["id"] for t in tasks]
+    if len(ids) != len(set(ids)):
+        duplicates = sorted({i for i in ids if ids.count(i) > 1})
+        violations.append(f"duplicate IDs: {duplicates[:10]}")
+
+    by_text = {t["text"]: t for t in tasks}
+    adds = [entry for result in results for entry in result["added"]]
+    added = {text: (task_id, priority, clears_before) for task_id, text, priority, clears_before in adds}
+    deleted = {text for result in results for text in result["deleted"]}
+    completed = {text for result in results for text in result["completed"]}
+    edits: dict[str, list[tuple[str, list[str]]]] = {}
+    for result in results:
+        for text, priority, tags in result.get("edited", []):
+            edits.setdefault(text, []).append((priority, tags))
+
+    # Texts are unique, IDs must be too: across clears, and after their task was deleted
+    handed_out = Counter(task_id for task_id, *_ in adds)
+    reused = sorted(task_id for task_id, count in handed_out.items() if count > 1)
+    if reused:
+        violations.append(f"IDs handed out more than once: {reused[:10]}")
+
+    for text, (task_id, _, clears_before) in added.items():
+        if clears_before == clears and text not in deleted and text not in by_text:
+            violations.append(f"lost task {text}")
+        if text in by_text and by_text[text]["id"] != task_id:
+            violations.append(f"task {text} was added as [{task_id}] but is now [{by_text[text]['id']}]")
+    for text, task in by_text.items():
+        if text not in added:
+            continue
+        final = (task["priority"], task["tags"] or [])
+        if text in edits and final not in edits[text]:
+            violations.append(f"lost edit of {text}: {final} matches none of its {len(edits[text])} edits")
+        elif text not in edits and final != (added[text][1], []):
+            violations.append(f"task {text} changed without being edited: {final}")
+    for text in deleted & by_text.keys():
+        violations.append(f"deleted task {text} came back")
+    for text in completed & by_text.keys():
+        if not by_text[text]["done"]:
+            violations.append(f"lost completion of {text}")
+    unexpected = by_text.keys() - added.keys()
+    if unexpected:
+        violations.append(f"{len(unexpected)} unexpected tasks, e.g. {sorted(unexpected)[:3]}")
+    return violations
+
+# -------------------------------
+# 🏁 Runner
+# -------------------------------
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+def run_stress(
+        data_file: str,
+        processes: int = 4,
+        ops: int = 50,
+        prefill: int = 0,
+        seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Run the stress test and return a report with ops/s, latencies and violations.
+    """
+    core.DATA_FILE = data_file
+    rng = random.Random(seed)
+    core.save_tasks([
+        {"id": i, "text": f"seed-{i}", "done": False, "priority": "medium", "created": "", "due": "", "tags": []}
+        for i in range(1, prefill + 1)
+    ])
+
+    ctx = multiprocessing.get_context("spawn")
+    stop, failures, reads = ctx.Event(), ctx.Value("i", 0), ctx.Value("i", 0)
+    clears, high_id = ctx.Value("i", 0), ctx.Value("i", prefill)
+    watcher = ctx.Process(target=reader, args=(data_file, stop, failures, reads), daemon=True)
+    watcher.start()
+
+    try:
+        with ctx.Pool(processes, initializer=init_worker, initargs=(clears, high_id)) as pool:
+            args = [(w, data_file, ops, rng.randrange(2**32)) for w in range(processes)]
+            started = time.perf_counter()
+            results = pool.starmap(worker, args)
+            seconds = time.perf_counter() - started
+    finally:
+        stop.set()
+        watcher.join()
+
+    # The prefilled tasks count as added before any clear
+    results.append({"added": [(i, f"seed-{i}", "medium", 0) for i in range(1, prefill + 1)], "deleted": [], "completed": []})
+    violations = [error for result in results for error in result.get("errors", [])]
+    violations.extend(check_store(data_file, results, clears.value))
+
+    latencies: dict[str, list[float]] = {op: [] for op in OPERATIONS}
+    for result in results:
+        for op, values in result.get("latencies", {}).items():
+            latencies[op].extend(values)
+    total_ops = processes * ops
+    return {
+        "ops": total_ops,
+        "seconds": seconds,
+        "ops_per_second": total_ops / seconds if seconds else 0.0,
+        "latency": {
+            op: {"count": len(v), "p50": percentile(v, 50), "p95": percentile(v, 95), "p99": percentile(v, 99), "max": max(v)}
+            for op, v in latencies.items() if v
+        },
+        "clears": clears.value,
+        "reads": reads.value,
+        "unreadable_reads": failures.value,
+        "violations": violations,
+    }
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stress test the Todo CLI X storage layer.")
+    parser.add_argument("--processes", type=int, default=8, help="Concurrent worker processes (default: 8)")
+    parser.add_argument("--ops", type=int, default=200, help="Operations per worker (default: 200)")
+    parser.add_argument("--prefill", type=int, default=10_000, help="Tasks in the store before starting (default: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = run_stress(os.path.join(tmp, "todo_data.json"), args.processes, args.ops, args.prefill, args.seed)
+
+    print(f"{report['ops']} operations in {report['seconds']:.2f}s — {report['ops_per_second']:,.0f} ops/s")
+    print(f"{'operation':<10} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for op, stats in report["latency"].items():
+        print(f"{op:<10} {stats['count']:>7} " + " ".join(f"{stats[k] * 1000:>9.2f}" for k in ("p50", "p95", "p99", "max")))
+    print(f"clears: {report['clears']}, concurrent reads: {report['reads']}, unreadable: {report['unreadable_reads']}")
+    if report["violations"]:
+        print(f"❌  {len(report['violations'])} invariant violations:")
+        for violation in report["violations"][:20]:
+            print(f"   - {violation}")
+        return 1
+    print("✅  All invariants hold")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
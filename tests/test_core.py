@@ -5,8 +5,11 @@
 # It uses pytest for testing and a separate test data file to avoid conflicts with production data.
 # ----------------------------------------------------------
 
+import itertools
+import json
 import os
 import pytest
+from datetime import date
 from todo_cli import core
 from typing import List, cast, Any
 from todo_cli.core import TaskDict
@@ -22,11 +25,15 @@ core.DATA_FILE = "test_todo_data.json"
 # -------------------------------
 @pytest.fixture(autouse=True)
 def cleanup_test_file():
-    if os.path.exists(core.DATA_FILE):
-        os.remove(core.DATA_FILE)
+    root = os.path.splitext(core.DATA_FILE)[0]
+    paths = (core.DATA_FILE, root + core.INDEX_SUFFIX, root + core.LOCK_SUFFIX, root + core.LAST_ID_SUFFIX)
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
     yield
-    if os.path.exists(core.DATA_FILE):
-        os.remove(core.DATA_FILE)
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
 
 # -------------------------------
 # ➕ Test: add_task()
@@ -112,6 +119,14 @@ def test_delete_task_fails_for_nonexistent_id():
     result = core.delete_task(12345)
     assert result is None
 
+def test_delete_tasks_removes_several_with_one_result_each():
+    for text in ("One", "Two", "Three"):
+        core.add_task(text, priority="high")
+    deleted = core.delete_tasks([3, 99, 1])
+    assert [t["text"] if t else None for t in deleted] == ["Three", None, "One"]
+    assert [t["text"] for t in core.list_tasks()] == ["Two"]
+    assert [t["text"] for t in core.next_tasks(3)] == ["Two"]
+
 # -------------------------------
 # 🧪 Sorting & Filtering (core logic-based)
 # -------------------------------
@@ -169,4 +184,256 @@ def test_edit_task_invalid_priority():
 
 def test_edit_task_nonexistent_id_returns_none():
     result = core.edit_task(task_id=999, text="Does not exist")
-    assert result is None
\ No newline at end of file
+    assert result is None
+# -------------------------------
+# 🔁 Test: recurring tasks
+# -------------------------------
+def test_add_recurring_task_stores_rule_once():
+    repeat = core.make_repeat("daily", interval=3, until="2025-01-10")
+    task = core.add_task("Water plants", due="2025-01-01", repeat=repeat)
+    assert task["repeat"] == {"frequency": "daily", "interval": 3, "until": "2025-01-10", "start": "2025-01-01"}
+    assert len(core.list_tasks()) == 1
+
+def test_add_recurring_task_without_due_starts_today():
+    task = core.add_task("Stand-up", repeat=core.make_repeat("daily"))
+    assert task["due"] == date.today().isoformat()
+
+def test_make_repeat_rejects_invalid_rules():
+    with pytest.raises(ValueError):
+        core.make_repeat(cast(Any, "hourly"))
+    with pytest.raises(ValueError):
+        core.make_repeat("daily", interval=0)
+    with pytest.raises(ValueError):
+        core.make_repeat("daily", until="10/01/2025")
+
+def test_add_task_validates_repeat_rule():
+    with pytest.raises(ValueError):
+        core.add_task("Loop", due="2025-01-01", repeat=cast(Any, {"frequency": "daily", "interval": 0, "until": ""}))
+    with pytest.raises(ValueError):
+        core.add_task("Ended", due="2025-02-01", repeat=core.make_repeat("daily", until="2025-01-31"))
+    assert core.list_tasks() == []
+
+def test_edit_task_rejects_due_after_repeat_until():
+    core.add_task("Gym", due="2025-01-01", repeat=core.make_repeat("daily", until="2025-01-10"))
+    with pytest.raises(ValueError):
+        core.edit_task(task_id=1, due="2025-01-11")
+    assert core.list_tasks()[0]["due"] == "2025-01-01"
+    assert core.edit_task(task_id=1, due="2025-01-10")["repeat"]["start"] == "2025-01-10"
+
+def test_iter_occurrences_respects_until():
+    task = core.add_task("Gym", due="2025-01-01", repeat=core.make_repeat("daily", interval=3, until="2025-01-10"))
+    dates = [d.isoformat() for d in core.iter_occurrences(task)]
+    assert dates == ["2025-01-01", "2025-01-04", "2025-01-07", "2025-01-10"]
+
+def test_iter_occurrences_is_lazy_and_windowed():
+    task = core.add_task("Backup", due="2025-01-06", repeat=core.make_repeat("weekly"))
+    window = core.iter_occurrences(task, start=date(2030, 1, 1), end=date(2030, 1, 31))
+    dates = [d.isoformat() for d in window]
+    assert dates == ["2030-01-07", "2030-01-14", "2030-01-21", "2030-01-28"]
+
+def test_monthly_occurrences_clamp_without_drifting():
+    task = core.add_task("Pay rent", due="2025-01-31", repeat=core.make_repeat("monthly"))
+    dates = [d.isoformat() for d in itertools.islice(core.iter_occurrences(task), 4)]
+    assert dates == ["2025-01-31", "2025-02-28", "2025-03-31", "2025-04-30"]
+
+def test_completing_monthly_task_repeatedly_does_not_drift():
+    task = core.add_task("Pay rent", due="2025-01-31", repeat=core.make_repeat("monthly"))
+    for _ in range(3):
+        task = next(t for t in core.list_tasks() if not t["done"])
+        core.complete_task(task["id"])
+    dues = [t["due"] for t in core.list_tasks()]
+    assert dues == ["2025-01-31", "2025-02-28", "2025-03-31", "2025-04-30"]
+
+def test_recurring_task_keeps_drift_free_rule_after_due_edit():
+    task = core.add_task("Report", due="2025-01-31", repeat=core.make_repeat("monthly"))
+    core.edit_task(task["id"], due="2025-01-30")
+    core.complete_task(task["id"])
+    assert core.list_tasks()[1]["due"] == "2025-02-28"
+    core.complete_task(2)
+    assert core.list_tasks()[2]["due"] == "2025-03-30"
+
+def test_complete_recurring_task_materializes_next_occurrence():
+    task = core.add_task("Weekly review", due="2025-01-06", tags=["work"], repeat=core.make_repeat("weekly"))
+    core.complete_task(task["id"])
+    tasks = core.list_tasks()
+    assert len(tasks) == 2
+    assert tasks[0]["done"] is True
+    assert tasks[1]["id"] == 2
+    assert tasks[1]["done"] is False
+    assert tasks[1]["due"] == "2025-01-13"
+    assert tasks[1]["repeat"] == task["repeat"]
+    assert tasks[1]["tags"] == ["work"]
+
+def test_complete_recurring_task_twice_does_not_duplicate():
+    task = core.add_task("Daily log", due="2025-01-01", repeat=core.make_repeat("daily"))
+    core.complete_task(task["id"])
+    core.complete_task(task["id"])
+    assert len(core.list_tasks()) == 2
+
+def test_complete_last_occurrence_stops_recurrence():
+    task = core.add_task("Course", due="2025-01-10", repeat=core.make_repeat("daily", until="2025-01-10"))
+    core.complete_task(task["id"])
+    assert len(core.list_tasks()) == 1
+
+def test_complete_task_records_created_occurrence():
+    core.add_task("Course", due="2025-01-10", repeat=core.make_repeat("daily", until="2025-01-11"))
+    core.add_task("Course", due="2025-01-11", repeat=core.make_repeat("daily", until="2025-01-11"))
+    done = core.complete_task(1)
+    assert done is not None and done["next_id"] == 3
+    assert core.list_tasks()[2]["due"] == "2025-01-11"
+    last = core.complete_task(3)
+    assert last is not None and "next_id" not in last
+
+def test_bulk_complete_records_created_occurrences():
+    core.add_task("Daily", due="2025-01-01", repeat=core.make_repeat("daily"))
+    core.add_task("One-off", due="2025-01-01")
+    core.bulk_update({"text": "."}, {"complete": True})
+    tasks = core.list_tasks()
+    assert tasks[0]["next_id"] == 3 and tasks[2]["due"] == "2025-01-02"
+    assert "next_id" not in tasks[1] and "next_id" not in tasks[2]
+
+def test_expand_occurrences_in_window_sorted_by_due():
+    core.add_task("Every other day", due="2025-01-01", repeat=core.make_repeat("daily", interval=2))
+    core.add_task("One-off", due="2025-01-04")
+    core.add_task("No due date")
+    rows = list(core.expand_occurrences(core.list_tasks(), date(2025, 1, 2), date(2025, 1, 6)))
+    assert [(t["id"], t["due"]) for t in rows] == [(1, "2025-01-03"), (2, "2025-01-04"), (1, "2025-01-05")]
+
+# -------------------------------
+# ⏭️ Test: next_tasks()
+# -------------------------------
+def _expected_next(count: int) -> List[int]:
+    open_tasks = [t for t in core.list_tasks() if not t["done"]]
+    open_tasks.sort(key=lambda t: (core.PRIORITY_RANK[t["priority"]], t["due"] or "9999-12-31", t["created"], t["id"]))
+    return [t["id"] for t in open_tasks[:count]]
+
+def test_next_tasks_orders_by_priority_due_and_age():
+    core.add_task("Low", priority="low", due="2025-01-01")
+    core.add_task("High, no due", priority="high")
+    core.add_task("High, due later", priority="high", due="2025-03-01")
+    core.add_task("High, due soon", priority="high", due="2025-02-01")
+    core.add_task("Medium", priority="medium")
+    assert [t["text"] for t in core.next_tasks(3)] == ["High, due soon", "High, due later", "High, no due"]
+
+def test_next_tasks_follows_add_edit_complete_delete():
+    for i in range(20):
+        core.add_task(f"Task {i}", priority=("low", "medium", "high")[i % 3], due=f"2025-01-{i % 9 + 1:02d}")
+    core.edit_task(task_id=1, priority="high", due="2024-12-31")
+    core.complete_task(3)
+    core.delete_task(6)
+    core.edit_task(task_id=9, priority="low")
+    assert [t["id"] for t in core.next_tasks(20)] == _expected_next(20)
+    assert core.next_tasks(1)[0]["id"] == 1
+
+def test_next_tasks_empty_after_clear():
+    core.add_task("Task 1")
+    core.next_tasks()
+    core.clear_tasks()
+    assert core.next_tasks(5) == []
+
+def test_next_tasks_rebuilds_after_external_change():
+    core.add_task("Medium")
+    assert core.next_tasks()[0]["text"] == "Medium"
+    tasks = core.list_tasks()
+    tasks.append({**tasks[0], "id": 2, "text": "Written by hand", "priority": "high"})
+    core.save_tasks(tasks)
+    assert core.next_tasks()[0]["text"] == "Written by hand"
+
+@pytest.mark.parametrize("index", ["[]\n", "null\n", "\"text\"\n", "{not json\n"])
+def test_next_tasks_rebuilds_after_bad_index_header(index):
+    core.add_task("Task 1")
+    core.next_tasks()
+    with open(os.path.splitext(core.DATA_FILE)[0] + core.INDEX_SUFFIX, "w", encoding="utf-8") as f:
+        f.write(index)
+    assert core.next_tasks()[0]["text"] == "Task 1"
+    core.add_task("Task 2", priority="high")
+    assert core.next_tasks()[0]["text"] == "Task 2"
+
+def test_next_tasks_reads_non_ascii_tasks_from_data_file():
+    core.add_task("Café ☕", priority="high", tags=["déjà"])
+    core.add_task("Plain")
+    with open(core.DATA_FILE, encoding="utf-8") as f:
+        assert f.read() == json.dumps(core.load_tasks(), indent=2, ensure_ascii=False)
+    assert core.next_tasks(2) == core.list_tasks()
+
+def test_next_tasks_rejects_non_positive_count():
+    with pytest.raises(ValueError):
+        core.next_tasks(0)
+
+# -------------------------------
+# 📦 Test: bulk_update()
+# -------------------------------
+def test_bulk_update_retags_matching_tasks():
+    core.add_task("Fix login bug", tags=["dev"])
+    core.add_task("Write docs", tags=["docs"])
+    core.add_task("Fix signup bug", tags=["dev", "old"])
+    result = core.bulk_update({"text": "^fix"}, {"add_tags": ["bug"], "remove_tags": ["OLD"]})
+    assert result["matched"] == 2
+    assert result["scanned"] == 3
+    assert [t["tags"] for t in core.list_tasks()] == [["dev", "bug"], ["docs"], ["dev", "bug"]]
+
+def test_bulk_update_reprioritizes_due_window():
+    core.add_task("In window", due="2025-06-02")
+    core.add_task("Outside window", due="2025-06-20")
+    core.add_task("No due date")
+    core.bulk_update({"due_from": "2025-06-01", "due_to": "2025-06-07"}, {"priority": "high"})
+    assert [t["priority"] for t in core.list_tasks()] == ["high", "medium", "medium"]
+    assert core.next_tasks(1)[0]["text"] == "In window"
+
+def test_bulk_update_complete_and_delete():
+    core.add_task("Daily", due="2025-01-01", tags=["chore"], repeat=core.make_repeat("daily"))
+    core.add_task("Once", tags=["chore"])
+    core.add_task("Other")
+    core.bulk_update({"tags": ["chore"], "done": False}, {"complete": True})
+    tasks = core.list_tasks()
+    assert [(t["id"], t["done"]) for t in tasks] == [(1, True), (2, True), (3, False), (4, False)]
+    assert tasks[3]["due"] == "2025-01-02"
+    core.bulk_update({"done": True}, {"delete": True})
+    assert [t["id"] for t in core.list_tasks()] == [3, 4]
+
+def test_bulk_update_with_worker_pool_matches_single_process():
+    for i in range(40):
+        core.add_task(f"Task {i}", priority=("low", "medium", "high")[i % 3], tags=["even"] if i % 2 == 0 else [])
+    core.bulk_update({"tags": ["even"]}, {"priority": "low", "add_tags": ["batch"]}, workers=1)
+    expected = core.list_tasks()
+    core.bulk_update({"tags": ["even"]}, {"remove_tags": ["batch"]}, workers=1)
+
+    result = core.bulk_update({"tags": ["even"]}, {"add_tags": ["batch"]}, workers=3)
+    assert result["workers"] == 3
+    assert core.list_tasks() == expected
+
+def test_bulk_update_rejects_invalid_requests():
+    core.add_task("Task")
+    with pytest.raises(ValueError):
+        core.bulk_update({"text": "("}, {"complete": True})
+    with pytest.raises(ValueError):
+        core.bulk_update({}, {})
+    with pytest.raises(ValueError):
+        core.bulk_update({}, {"delete": True, "complete": True})
+    with pytest.raises(ValueError):
+        core.bulk_update({"text": "Task"}, {"complete": True}, workers=0)
+    assert core.list_tasks()[0]["done"] is False
+
+@pytest.mark.parametrize("query, update", [
+    ({}, {"delete": True}),
+    ({"tags": []}, {"delete": True}),
+    ({"tags": "dev"}, {"complete": True}),
+    ({"tags": [1]}, {"complete": True}),
+    ({"done": "no"}, {"complete": True}),
+    ({"priority": "urgent"}, {"complete": True}),
+    ({"text": "."}, {"add_tags": [1, None]}),
+    ({"text": "."}, {"add_tags": "xyz"}),
+    ({"text": "."}, {"remove_tags": ["ok", 2]}),
+    ({"text": "."}, {"complete": "yes"}),
+    ({"text": ".", "owner": "me"}, {"complete": True}),
+])
+def test_bulk_update_rejects_malformed_fields(query, update):
+    core.add_task("Task", tags=["dev"])
+    with pytest.raises(ValueError):
+        core.bulk_update(query, update)
+    assert core.list_tasks()[0]["tags"] == ["dev"] and core.list_tasks()[0]["done"] is False
+
+def test_bulk_update_empty_pattern_selects_every_task():
+    core.add_task("One")
+    core.add_task("Two")
+    assert core.bulk_update({"text": ""}, {"complete": True})["matched"] == 2
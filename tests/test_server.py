@@ -0,0 +1,240 @@
+# ----------------------------------------------------------
+# ✅ Tests for server.py and client.py (sync server)
+# This module runs a real `todo serve` server on a local port in a background
+# thread and talks to it through RemoteStore, like the CLI does with --server.
+# ----------------------------------------------------------
+
+import asyncio
+import contextlib
+import http.server
+import threading
+from typing import Iterator, Optional
+import pytest
+from todo_cli import core
+from todo_cli.client import BatchError, RemoteStore
+from todo_cli.server import SyncServer
+
+# -------------------------------
+# 🔧 Local server fixture
+# -------------------------------
+@contextlib.contextmanager
+def running_server(token: Optional[str] = None) -> Iterator[str]:
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(SyncServer(token).start("127.0.0.1", 0))
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"127.0.0.1:{port}"
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+
+@pytest.fixture
+def server_url(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "DATA_FILE", str(tmp_path / "todo_data.json"))
+    with running_server() as url:
+        yield url
+
+@pytest.fixture
+def make_client(server_url, tmp_path):
+    clients: list[RemoteStore] = []
+    def make(name: str = "client") -> RemoteStore:
+        client = RemoteStore(server_url, cache_file=str(tmp_path / f"{name}_cache.json"))
+        clients.append(client)
+        return client
+    yield make
+    for client in clients:
+        client.close()
+
+# -------------------------------
+# 🔁 Test: remote store mirrors core
+# -------------------------------
+def test_remote_add_and_list(make_client):
+    client = make_client()
+    task = client.add_task("Remote task", priority="high", tags=["sync"])
+    assert task["id"] == 1
+    assert [t["text"] for t in client.list_tasks()] == ["Remote task"]
+    assert core.list_tasks()[0]["text"] == "Remote task"  # Persisted by the server
+
+def test_remote_complete_edit_delete(make_client):
+    client = make_client()
+    client.add_task("One")
+    client.add_task("Two")
+    assert client.complete_task(1)["done"] is True
+    assert client.edit_task(2, text="Two (edited)")["text"] == "Two (edited)"
+    assert client.delete_task(1)["id"] == 1
+    assert client.delete_task(99) is None
+    assert [t["text"] for t in client.list_tasks()] == ["Two (edited)"]
+
+def test_remote_complete_reports_next_occurrence(make_client):
+    client = make_client()
+    client.add_task("Standup", due="2025-01-06", repeat=core.make_repeat("weekly"))
+    assert client.complete_task(1)["next_id"] == 2
+    assert client.list_tasks()[1]["due"] == "2025-01-13"
+
+def test_remote_invalid_operation_raises_value_error(make_client):
+    client = make_client()
+    client.add_task("Task")
+    with pytest.raises(ValueError):
+        client.edit_task(1, due="not-a-date")
+
+def test_remote_invalid_address_raises_value_error(tmp_path):
+    with pytest.raises(ValueError, match="address"):
+        RemoteStore("localhost:notaport", cache_file=str(tmp_path / "cache.json"))
+
+def test_remote_non_json_server_raises_value_error(tmp_path):
+    server = http.server.HTTPServer(("127.0.0.1", 0), http.server.SimpleHTTPRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = RemoteStore(f"127.0.0.1:{server.server_port}", cache_file=str(tmp_path / "cache.json"))
+    try:
+        with pytest.raises(ValueError, match="sync server"):
+            client.list_tasks()
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+@pytest.mark.parametrize("payload", [
+    [],
+    {"ops": ["x"]},
+    {"ops": [{"op": "add"}]},
+    {"ops": [{"op": "add", "text": "Loop", "repeat": {"frequency": "daily", "interval": 0}}]},
+    {"ops": [{"op": "complete", "id": "1"}]},
+    {"ops": [{"op": "edit", "id": 1, "tags": [1]}]},
+    {"ops": [{"op": "clear"}], "since": "0"},
+    {"ops": [{"op": "bulk", "query": {}, "update": {"complete": True}}]},
+    {"ops": [{"op": "bulk", "query": {"text": "."}, "update": {"add_tags": [1, None]}}]},
+    {"ops": [{"op": "bulk", "query": {"text": "."}, "update": {"add_tags": "xyz"}}]},
+    {"ops": [{"op": "bulk", "query": {"tags": "Kept"}, "update": {"complete": True}}]},
+    {"ops": [{"op": "bulk", "query": {"done": "no", "priority": 1}, "update": {"complete": True}}]},
+])
+def test_malformed_batch_is_rejected_before_applying(make_client, payload):
+    client = make_client()
+    client.add_task("Kept")
+    with pytest.raises(ValueError):
+        client.pool.request("POST", "/batch", payload)
+    assert [t["text"] for t in core.list_tasks()] == ["Kept"]
+
+def test_unexpected_server_error_answers_500(make_client, monkeypatch, capsys):
+    client = make_client()
+    client.add_task("Task")
+    complete_task = core.complete_task
+    def broken(task_id):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(core, "complete_task", broken)
+    with pytest.raises(ValueError, match="boom"):
+        client.complete_task(1)
+    assert "RuntimeError" in capsys.readouterr().err
+    monkeypatch.setattr(core, "complete_task", complete_task)
+    assert client.complete_task(1)["done"] is True  # The server keeps serving
+
+def test_server_with_token_rejects_other_clients(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "DATA_FILE", str(tmp_path / "todo_data.json"))
+    with running_server(token="s3cret") as url:
+        owner, anonymous, guess = (
+            RemoteStore(url, cache_file=str(tmp_path / f"{name}.json"), token=token)
+            for name, token in (("owner", "s3cret"), ("anonymous", None), ("guess", "guess"))
+        )
+        owner.add_task("Private")
+        for client in (anonymous, guess):
+            with pytest.raises(ValueError, match="token"):
+                client.list_tasks()
+            with pytest.raises(ValueError, match="token"):
+                client.clear_tasks()
+        assert [t["text"] for t in owner.list_tasks()] == ["Private"]
+        for client in (owner, anonymous, guess):
+            client.close()
+
+# -------------------------------
+# 📡 Test: delta sync between clients
+# -------------------------------
+def test_sync_downloads_only_changes(make_client):
+    alice, bob = make_client("alice"), make_client("bob")
+    for i in range(5):
+        alice.add_task(f"Task {i}")
+    assert len(bob.list_tasks()) == 5
+
+    alice.edit_task(3, priority="high")
+    alice.delete_task(5)
+    delta = bob.pool.request("GET", f"/sync?since={bob._cache['revision']}&epoch={bob._cache['epoch']}")
+    assert delta["full"] is False
+    assert [t["id"] for t in delta["tasks"]] == [3]
+    assert delta["deleted"] == [5]
+
+    tasks = bob.list_tasks()
+    assert [t["id"] for t in tasks] == [1, 2, 3, 4]
+    assert tasks[2]["priority"] == "high"
+
+def test_sync_sees_clear_and_local_changes(make_client):
+    alice, bob = make_client("alice"), make_client("bob")
+    alice.add_task("Task")
+    bob.list_tasks()
+    alice.clear_tasks()
+    core.save_tasks([{"id": 7, "text": "Edited on the server machine", "done": False, "priority": "low", "created": "", "due": "", "tags": []}])
+    assert [t["id"] for t in bob.list_tasks()] == [7]
+
+def test_unknown_epoch_gets_full_snapshot(make_client):
+    client = make_client()
+    client.add_task("Task")
+    delta = client.pool.request("GET", "/sync?since=100&epoch=old")
+    assert delta["full"] is True
+    assert len(delta["tasks"]) == 1
+
+# -------------------------------
+# 🏊 Test: connection pooling
+# -------------------------------
+def test_client_reuses_connection(make_client):
+    client = make_client()
+    client.list_tasks()
+    conn = client.pool._idle.queue[0]
+    client.add_task("Task")
+    client.list_tasks()
+    assert list(client.pool._idle.queue) == [conn]
+
+# -------------------------------
+# 📦 Test: remote bulk update
+# -------------------------------
+def test_remote_bulk_update_sends_one_batch(make_client):
+    client = make_client()
+    client.add_task("Fix bug", tags=["dev"])
+    client.add_task("Write docs")
+    result = client.bulk_update({"text": "fix"}, {"priority": "high", "add_tags": ["bug"], "complete": True})
+    assert result["matched"] == 1
+    task = client.list_tasks()[0]
+    assert (task["priority"], task["tags"], task["done"]) == ("high", ["dev", "bug"], True)
+
+def test_remote_bulk_update_keeps_concurrent_changes(make_client):
+    alice, bob = make_client("alice"), make_client("bob")
+    alice.add_task("Fix bug", tags=["dev"])
+    bob.list_tasks()
+    alice.edit_task(1, tags=["dev", "urgent"])  # Not synced by bob yet
+    bob.bulk_update({"text": "fix"}, {"add_tags": ["bug"]})
+    assert core.list_tasks()[0]["tags"] == ["dev", "urgent", "bug"]
+
+# -------------------------------
+# 📦 Test: batches with failures
+# -------------------------------
+def test_batch_reports_partial_results(make_client):
+    client = make_client()
+    client.add_task("One")
+    with pytest.raises(BatchError) as error:
+        client.batch([
+            {"op": "edit", "id": 1, "due": "not-a-date"},
+            {"op": "add", "text": "Two"},
+        ])
+    assert error.value.results[0] is None
+    assert error.value.results[1]["text"] == "Two"
+    assert list(error.value.errors) == [0]
+    assert [t["text"] for t in client.list_tasks()] == ["One", "Two"]
+
+def test_remote_delete_tasks_in_one_request(make_client):
+    client = make_client()
+    for text in ("One", "Two", "Three"):
+        client.add_task(text)
+    deleted = client.delete_tasks([1, 3, 7])
+    assert [t and t["text"] for t in deleted] == ["One", "Three", None]
+    assert [t["text"] for t in client.list_tasks()] == ["Two"]
@@ -0,0 +1,108 @@
+# ----------------------------------------------------------
+# ✅ Stress & property tests for core.py (storage layer)
+# This module checks storage invariants under random operation sequences:
+# - in one process, against a simple in-memory model of the task list
+# - from several concurrent processes, through tests/stress_harness.py
+# ----------------------------------------------------------
+
+import itertools
+import random
+import pytest
+from typing import Any, Iterator
+from todo_cli import core
+from stress_harness import run_stress
+
+@pytest.fixture(autouse=True)
+def isolated_data_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "DATA_FILE", str(tmp_path / "todo_data.json"))
+
+# -------------------------------
+# 🎲 Property test: random sequences vs a model
+# -------------------------------
+def apply_to_model(model: list[dict[str, Any]], ids: Iterator[int], op: str, arg: Any) -> Any:
+    """
+    Reference behavior of each operation on a plain list of tasks.
+    New tasks take the next value of `ids`: an ID is never handed out twice.
+    """
+    found = next((t for t in model if t["id"] == arg), None)
+    if op == "add":
+        task = {"id": next(ids), "text": arg, "done": False, "priority": "medium"}
+        model.append(task)
+        return task["id"]
+    if op == "complete" and found:
+        found["done"] = True
+    if op == "edit" and found:
+        found["priority"] = "high"
+    if op == "delete" and found:
+        model.remove(found)
+    if op == "clear":
+        model.clear()
+        return None
+    return found["id"] if found else None
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_operations_match_model(seed):
+    rng = random.Random(seed)
+    model: list[dict[str, Any]] = []
+    new_ids = itertools.count(1)
+    for n in range(120):
+        op = rng.choices(["add", "complete", "edit", "delete", "clear"], [40, 20, 20, 18, 2])[0]
+        arg: Any = f"task {n}" if op == "add" else rng.randint(1, max(1, len(model) + 2))
+
+        if op == "add":
+            result = core.add_task(arg)["id"]
+        elif op == "complete":
+            task = core.complete_task(arg)
+            result = task["id"] if task else None
+        elif op == "edit":
+            task = core.edit_task(arg, priority="high")
+            result = task["id"] if task else None
+        elif op == "delete":
+            task = core.delete_task(arg)
+            result = task["id"] if task else None
+        else:
+            result = core.clear_tasks()
+
+        assert result == apply_to_model(model, new_ids, op, arg), f"step {n}: {op}({arg})"
+        stored = [{k: t[k] for k in ("id", "text", "done", "priority")} for t in core.list_tasks()]
+        assert stored == model
+        ids = [t["id"] for t in stored]
+        assert len(ids) == len(set(ids))
+        assert [t["id"] for t in core.next_tasks(len(model) + 1)] == [
+            t["id"] for t in sorted((t for t in core.list_tasks() if not t["done"]), key=core.task_order_key)
+        ]
+
+# -------------------------------
+# 🔥 Stress test: concurrent processes
+# -------------------------------
+def test_concurrent_processes_keep_invariants(tmp_path):
+    report = run_stress(str(tmp_path / "stress.json"), processes=4, ops=40, prefill=300, seed=1)
+    assert report["violations"] == []
+    assert report["unreadable_reads"] == 0
+    assert report["ops_per_second"] > 0
+    assert {"add", "edit", "complete", "delete", "clear"} <= set(report["latency"])
+
+# -------------------------------
+# 🩹 Regressions found by the harness
+# -------------------------------
+def test_add_task_ids_follow_highest_id_not_last():
+    core.save_tasks([
+        {"id": 5, "text": "Five", "done": False, "priority": "medium", "created": "", "due": "", "tags": []},
+        {"id": 2, "text": "Two", "done": False, "priority": "medium", "created": "", "due": "", "tags": []},
+    ])
+    assert core.add_task("New")["id"] == 6
+
+def test_ids_of_deleted_tasks_are_never_reused():
+    core.add_task("One")
+    core.delete_task(core.add_task("Two")["id"])
+    assert core.add_task("Three")["id"] == 3
+    core.clear_tasks()
+    assert core.add_task("Four")["id"] == 4
+
+def test_corrupt_file_is_backed_up_before_being_replaced(tmp_path):
+    with open(core.DATA_FILE, "w", encoding="utf-8") as f:
+        f.write('[{"id": 1, "text": "half-writ')
+    assert core.list_tasks() == []
+    core.add_task("New")
+    with open(core.DATA_FILE + core.CORRUPT_SUFFIX, encoding="utf-8") as f:
+        assert f.read() == '[{"id": 1, "text": "half-writ'
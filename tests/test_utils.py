@@ -5,8 +5,9 @@
 # It ensures that task tables are formatted as expected in a human-readable layout.
 # ----------------------------------------------------------
 
+import os
 from todo_cli.core import TaskDict
-from todo_cli.utils import format_task_table
+from todo_cli.utils import format_repeat, format_task_table, redraw_lines, render_task_view
 
 # -------------------------------
 # 🧪 Mock Data
@@ -85,4 +86,47 @@ def test_format_task_table_alignment():
 # -------------------------------
 def test_format_task_table_with_empty_list():
     output = format_task_table([], verbose=True)
-    assert "No tasks to display" in output
\ No newline at end of file
+    assert "No tasks to display" in output
+
+# -------------------------------
+# 🔁 Test: redraw_lines() only rewrites changed rows
+# -------------------------------
+def test_redraw_lines_first_draw_writes_everything():
+    output = redraw_lines([], ["a", "b"])
+    assert output == "\x1b[2Ka\n\x1b[2Kb\n"
+
+def test_redraw_lines_skips_unchanged_rows():
+    output = redraw_lines(["a", "b", "c"], ["a", "B", "c"])
+    assert output == "\x1b[3F\n\x1b[2KB\n\n"
+
+def test_redraw_lines_erases_removed_rows():
+    output = redraw_lines(["a", "b", "c"], ["a"])
+    assert output.endswith("\x1b[J")
+    assert "b" not in output
+
+def test_redraw_lines_crops_long_rows_to_terminal_width():
+    output = redraw_lines([], ["abcdefghij", "✅ done"], os.terminal_size((6, 24)))
+    assert output == "\x1b[2Kabcde\n\x1b[2K✅ do\n"
+
+def test_redraw_lines_clears_screen_when_view_is_taller_than_terminal():
+    lines = [f"row {i}" for i in range(10)]
+    output = redraw_lines(lines[:3], lines, os.terminal_size((80, 5)))
+    assert output.startswith("\x1b[H\x1b[2J")
+    assert "\x1b[3F" not in output
+    assert output.count("\n") == 4
+
+# -------------------------------
+# 📋 Test: render_task_view() matches `todo list` output
+# -------------------------------
+def test_render_task_view_includes_summary():
+    lines = render_task_view(MOCK_TASKS)
+    assert lines[-1].endswith("3 tasks — 1 completed, 2 remaining")
+    assert lines[:-2] == format_task_table(MOCK_TASKS).splitlines()
+
+# -------------------------------
+# 🔁 Test: format_repeat()
+# -------------------------------
+def test_format_repeat_descriptions():
+    assert format_repeat(None) == ""
+    assert format_repeat({"frequency": "weekly", "interval": 1, "until": ""}) == "weekly"
+    assert format_repeat({"frequency": "daily", "interval": 3, "until": "2025-12-31"}) == "every 3 days until 2025-12-31"
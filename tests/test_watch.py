@@ -0,0 +1,54 @@
+# ----------------------------------------------------------
+# ✅ Unit Tests for watch.py (data file watcher)
+# This module checks that the watcher wakes up on real changes to the data file,
+# ignores unrelated activity, and behaves the same with inotify or stat polling.
+# ----------------------------------------------------------
+
+import pytest
+from todo_cli.core import file_signature
+from todo_cli.watch import DataFileWatcher
+
+@pytest.fixture(params=[True, False], ids=["inotify", "poll"])
+def use_inotify(request):
+    return request.param
+
+# -------------------------------
+# 🔎 Test: file_signature()
+# -------------------------------
+def test_file_signature_missing_file_is_none(tmp_path):
+    assert file_signature(str(tmp_path / "missing.json")) is None
+
+def test_file_signature_changes_when_file_changes(tmp_path):
+    path = tmp_path / "todo_data.json"
+    path.write_text("[]")
+    before = file_signature(str(path))
+    path.write_text('[{"id": 1}]')
+    assert file_signature(str(path)) != before
+
+# -------------------------------
+# 🔔 Test: DataFileWatcher.wait()
+# -------------------------------
+def test_wait_times_out_without_changes(tmp_path, use_inotify):
+    path = tmp_path / "todo_data.json"
+    path.write_text("[]")
+    with DataFileWatcher(str(path), interval=0.01, use_inotify=use_inotify) as watcher:
+        assert watcher.wait(timeout=0.05) is False
+
+def test_wait_detects_change(tmp_path, use_inotify):
+    path = tmp_path / "todo_data.json"
+    path.write_text("[]")
+    with DataFileWatcher(str(path), interval=0.01, use_inotify=use_inotify) as watcher:
+        path.write_text('[{"id": 1}]')
+        assert watcher.wait(timeout=1.0) is True
+
+@pytest.mark.parametrize("interval", [0, -1.0, float("nan")])
+def test_rejects_non_positive_interval(tmp_path, interval):
+    with pytest.raises(ValueError):
+        DataFileWatcher(str(tmp_path / "todo_data.json"), interval=interval)
+
+def test_wait_ignores_other_files(tmp_path, use_inotify):
+    path = tmp_path / "todo_data.json"
+    path.write_text("[]")
+    with DataFileWatcher(str(path), interval=0.01, use_inotify=use_inotify) as watcher:
+        (tmp_path / "other.txt").write_text("noise")
+        assert watcher.wait(timeout=0.05) is False